@@ -9,8 +9,9 @@ import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
 from bson import ObjectId
+from bson.errors import InvalidDocument
 import logging
 
 # Configure logging
@@ -452,22 +453,54 @@ class MongoDBManager:
         failure_count = 0
         duplicate_count = 0
         
+        if not leads_data:
+            return {
+                'success_count': 0,
+                'duplicate_count': 0,
+                'failure_count': 0,
+                'total_processed': 0
+            }
+        
+        # Add metadata
+        scraped_at = datetime.utcnow()
         for lead_data in leads_data:
-            try:
-                # Add metadata
-                lead_data['scraped_at'] = datetime.utcnow()
-                lead_data['source'] = f'{source}_scraper'
-                
-                # Insert into appropriate collection
-                result = self.db[self.collections[source]].insert_one(lead_data)
-                success_count += 1
-                
-            except DuplicateKeyError:
-                duplicate_count += 1
-                logger.warning(f"⚠️ Duplicate lead for URL: {lead_data.get('url')}")
-            except Exception as e:
-                failure_count += 1
-                logger.error(f"❌ Failed to insert lead: {e}")
+            lead_data['scraped_at'] = scraped_at
+            lead_data['source'] = f'{source}_scraper'
+        
+        collection = self.db[self.collections[source]]
+        try:
+            # Single round trip; ordered=False so one bad document does not abort the rest
+            result = collection.insert_many(leads_data, ordered=False)
+            success_count = len(result.inserted_ids)
+            
+        except BulkWriteError as e:
+            success_count = e.details.get('nInserted', 0)
+            for error in e.details.get('writeErrors', []):
+                if error.get('code') == 11000:
+                    duplicate_count += 1
+                    logger.warning(f"⚠️ Duplicate lead for URL: {error.get('op', {}).get('url')}")
+                else:
+                    failure_count += 1
+                    logger.error(f"❌ Failed to insert lead: {error.get('errmsg')}")
+        
+        except InvalidDocument as e:
+            # A document that cannot be encoded fails the whole bulk call, so insert one by one
+            logger.warning(f"⚠️ Bulk insert failed ({e}), retrying documents individually")
+            for lead_data in leads_data:
+                try:
+                    collection.insert_one(lead_data)
+                    success_count += 1
+                    
+                except DuplicateKeyError:
+                    duplicate_count += 1
+                    logger.warning(f"⚠️ Duplicate lead for URL: {lead_data.get('url')}")
+                except Exception as e:
+                    failure_count += 1
+                    logger.error(f"❌ Failed to insert lead: {e}")
+        
+        except Exception as e:
+            failure_count = len(leads_data)
+            logger.error(f"❌ Failed to insert leads: {e}")
         
         logger.info(f"📊 Batch insert completed - Success: {success_count}, Duplicates: {duplicate_count}, Failures: {failure_count}")
         
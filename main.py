@@ -845,7 +845,8 @@ class LeadGenerationOrchestrator:
                     urls=urls_general[:5],  # Limit to 5 URLs
                     export_format="json",
                     generate_final_leads=True,
-                    icp_identifier=icp_identifier
+                    icp_identifier=icp_identifier,
+                    build_unified=True
                 )
                 
                 # Transform and store web scraper results in unified collection
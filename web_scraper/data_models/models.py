@@ -20,7 +20,8 @@ class PageContent(BaseModel):
 	encoding: Optional[str]
 	content_type: Optional[str]
 	html: str
-	text: str
+	# The scrapers leave this empty; process_content derives cleaned text from html in a single parse
+	text: str = ""
 	metadata: Dict[str, str] = Field(default_factory=dict)
 	processed: Optional[Dict[str, Any]] = None
 
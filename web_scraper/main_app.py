@@ -9,18 +9,24 @@ from __future__ import annotations
 import json
 import csv
 import hashlib
+import itertools
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import atexit
+import multiprocessing
+import threading
 import time
+import weakref
 
+import orjson
 from loguru import logger
 from pydantic import ValidationError
 
 from web_scraper.utils.classification import classify_url
 from web_scraper.scrapers.scraper_static import StaticScraper
-from web_scraper.scrapers.scraper_dynamic import fetch_dynamic
+from web_scraper.scrapers.scraper_dynamic import DynamicBrowserSession
 from web_scraper.processors.processing import process_content
 from web_scraper.ai_integration.ai import disambiguate_business_entities, generate_extraction_strategy, validate_and_enhance, extract_client_info_from_sections
 from web_scraper.extractors.lead_extraction import extract_lead_information, smart_filter_sections
@@ -32,13 +38,93 @@ import os
 import re
 import json
 import sys
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit
 
 # Add parent directory to path to import database module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.mongodb_manager import get_mongodb_manager
 
+# Patterns used to build debug filenames from URLs
+_WWW_RE = re.compile(r'^www\.')
+_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Shared read-only fallback for missing nested dicts; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+def _extract_lead_info(html: str, url: str) -> Dict[str, Any]:
+    """
+    CPU-bound part of Step 5-6: process page HTML and extract lead information.
+    Kept at module level so it can run in a ProcessPoolExecutor worker.
+    """
+    # Step 5: Process and structure page data
+    processed_content = process_content(html)
+    logger.debug(f"Content processed for {url}")
+
+    logger.debug(f"moved to step 6 towards extraction of lead information for {url}")
+
+    cleaned_text = processed_content.get("cleaned_text", "")
+
+    # Ensure cleaned_text is a string before passing it
+    if not isinstance(cleaned_text, str):
+        if isinstance(cleaned_text, dict):
+            # Extract text content from the dict
+            text_parts = []
+            for key, value in cleaned_text.items():
+                if isinstance(value, str):
+                    text_parts.append(value)
+            cleaned_text = " ".join(text_parts) if text_parts else ""
+        else:
+            cleaned_text = str(cleaned_text) if cleaned_text is not None else ""
+
+    # Step 6: Extract lead information with AI integration
+    lead_info = extract_lead_information(
+        html, 
+        cleaned_text, 
+        url,
+        sections=processed_content.get("sections", []),
+        structured_data=processed_content.get("structured_data", [])  # Pass structured data
+    )
+    lead_info["extraction_metadata"]["extraction_timestamp"] = datetime.now().isoformat()
+    logger.debug(f"Extract lead information for {url}")
+    return lead_info
+
+
+def _weak_callback(method) -> Any:
+    """Wrap a bound method so holding the wrapper (e.g. in atexit) does not keep its object alive"""
+    ref = weakref.WeakMethod(method)
+    
+    def call():
+        bound = ref()
+        if bound is not None:
+            bound()
+    
+    return call
+
+
+def _iter_final_json(final_leads: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Yield final_leads.json as bytes chunks, encoding one lead at a time.
+    Output matches orjson.dumps({"leads": ..., "metadata": ...}, option=OPT_INDENT_2)
+    without holding the whole encoded document in memory.
+    """
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    
+    if final_leads:
+        yield b'{\n  "leads": [\n'
+        for idx, lead in enumerate(final_leads):
+            if idx:
+                yield b',\n'
+            # orjson escapes newlines inside strings, so every raw newline is layout and safe to re-indent
+            yield b'    ' + orjson.dumps(lead, option=option).replace(b'\n', b'\n    ')
+        yield b'\n  ],\n  "metadata": '
+    else:
+        yield b'{\n  "leads": [],\n  "metadata": '
+    
+    yield orjson.dumps(metadata, option=option).replace(b'\n', b'\n  ')
+    yield b'\n}'
+
+
 class WebScraperOrchestrator:
     """Main orchestrator for the web scraping pipeline"""
     
@@ -50,7 +136,8 @@ class WebScraperOrchestrator:
                  delay_between_requests: float = 1.0,
                  use_mongodb: bool = True,
                  max_retries: int = 2,
-                 enable_retry: bool = True):
+                 enable_retry: bool = True,
+                 extraction_workers: Optional[int] = None):
         """
         Initialize the orchestrator
         
@@ -63,6 +150,7 @@ class WebScraperOrchestrator:
             use_mongodb: Whether to save data to MongoDB (default: True)
             max_retries: Maximum number of retries for network errors (default: 2)
             enable_retry: Whether to enable retry mechanism for network errors (default: True)
+            extraction_workers: Processes for CPU-bound content extraction (default: CPU count)
         """
         self.storage = LeadStorage(storage_path)
         self.export_manager = ExportManager(self.storage)
@@ -75,11 +163,36 @@ class WebScraperOrchestrator:
         self.use_mongodb = use_mongodb
         self.max_retries = max_retries
         self.enable_retry = enable_retry
+        self.extraction_workers = extraction_workers or os.cpu_count()
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
         
         # Track processed URLs to avoid duplicates
         self.processed_urls: Set[str] = set()
         self.duplicate_leads: List[Dict[str, Any]] = []
         
+        # Maps id() of each lead accepted in the current batch to its index in successful_leads
+        self._accepted_by_id: Dict[int, int] = {}
+        
+        # Buffered MongoDB writes, flushed with insert_many by size or age
+        self._mongo_buffer: List[Dict[str, Any]] = []
+        self._mongo_flush_size = 50
+        self._mongo_flush_interval = 5.0
+        self._mongo_last_flush = time.monotonic()
+        
+        # One reusable Playwright browser session per worker thread
+        self._dynamic_local = threading.local()
+        self._dynamic_sessions: List[DynamicBrowserSession] = []
+        self._dynamic_sessions_lock = threading.Lock()
+        # Registered weakly so an orchestrator that is never closed can still be collected
+        self._atexit_close = _weak_callback(self._close_dynamic_sessions)
+        atexit.register(self._atexit_close)
+        
+        # Debug output directory at the project root level, created on the first save
+        self._debug_dir = Path("debug_results")
+        
+        # Output directories already created by this orchestrator
+        self._ensured_dirs: Set[str] = set()
+        
         # Initialize MongoDB manager if needed
         if self.use_mongodb:
             try:
@@ -91,6 +204,14 @@ class WebScraperOrchestrator:
         
         logger.info(f"Initialized WebScraperOrchestrator with storage at {storage_path}")
     
+    def close(self):
+        """Flush pending MongoDB writes and release browser sessions and worker processes"""
+        if self.use_mongodb:
+            self._flush_mongo()
+        self._close_dynamic_sessions()
+        self._shutdown_extraction_pool()
+        atexit.unregister(self._atexit_close)
+    
     def load_urls_from_file(self, file_path: str) -> List[str]:
         """Load URLs from various file formats"""
         file_path = Path(file_path)
@@ -98,14 +219,13 @@ class WebScraperOrchestrator:
         
         try:
             if file_path.suffix.lower() == '.json':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        urls = [str(url) for url in data]
-                    elif isinstance(data, dict) and 'urls' in data:
-                        urls = [str(url) for url in data['urls']]
-                    else:
-                        logger.error(f"Invalid JSON format in {file_path}")
+                data = orjson.loads(file_path.read_bytes())
+                if isinstance(data, list):
+                    urls = [str(url) for url in data]
+                elif isinstance(data, dict) and 'urls' in data:
+                    urls = [str(url) for url in data['urls']]
+                else:
+                    logger.error(f"Invalid JSON format in {file_path}")
                         
             elif file_path.suffix.lower() == '.csv':
                 with open(file_path, 'r', encoding='utf-8') as f:
@@ -163,6 +283,25 @@ class WebScraperOrchestrator:
             logger.error(f"Failed to process URL {url}: {e}")
             return None
     
+    def _fetch_dynamic_reusing(self, url: str):
+        """Fetch a URL dynamically using the browser session owned by the current worker thread"""
+        session = getattr(self._dynamic_local, 'session', None)
+        if session is None:
+            session = DynamicBrowserSession()
+            self._dynamic_local.session = session
+            with self._dynamic_sessions_lock:
+                self._dynamic_sessions.append(session)
+        return session.fetch(url)
+    
+    def _close_dynamic_sessions(self):
+        """Close all per-thread browser sessions; worker threads must be finished"""
+        with self._dynamic_sessions_lock:
+            sessions, self._dynamic_sessions = self._dynamic_sessions, []
+        for session in sessions:
+            session.close()
+        # Sessions are bound to their threads, so start fresh for the next pool
+        self._dynamic_local = threading.local()
+    
     def _fetch_with_retry(self, url: str, fetch_type: str, max_retries: int) -> Optional[Any]:
         """
         Fetch content with retry logic for network errors
@@ -182,7 +321,7 @@ class WebScraperOrchestrator:
                     logger.info(f"Static fetch successful for {url}")
                     return page_content
                 else:
-                    page_content = fetch_dynamic(url)
+                    page_content = self._fetch_dynamic_reusing(url)
                     logger.info(f"Dynamic fetch successful for {url}")
                     return page_content
                     
@@ -209,7 +348,7 @@ class WebScraperOrchestrator:
                         logger.warning(f"Static fetch failed for {url}, trying dynamic: {e}")
                         # Try dynamic as fallback
                         try:
-                            page_content = fetch_dynamic(url)
+                            page_content = self._fetch_dynamic_reusing(url)
                             logger.info(f"Dynamic fallback successful for {url}")
                             return page_content
                         except Exception as e2:
@@ -244,15 +383,16 @@ class WebScraperOrchestrator:
         if sections is None:
             sections = []
 
-        # Ensure debug_results directory exists at the project root level
-        debug_dir = Path("debug_results")  # Use Path object for better cross-platform compatibility
-        debug_dir.mkdir(exist_ok=True)
+        debug_dir = self._debug_dir
+        if str(debug_dir) not in self._ensured_dirs:
+            debug_dir.mkdir(exist_ok=True)
+            self._ensured_dirs.add(str(debug_dir))
 
         # Extract hostname and path for identifier
         try:
             parsed = urlparse(url)
             hostname = parsed.hostname or "unknown_host"
-            hostname = re.sub(r'^www\.', '', hostname)  # remove www.
+            hostname = _WWW_RE.sub('', hostname)  # remove www.
             parts = hostname.split('.')  # break into words
             identifier = "_".join(parts[:3]) if parts else "unknown"  # take first 3 parts (adjustable)
 
@@ -262,7 +402,7 @@ class WebScraperOrchestrator:
                 identifier += f"_{path_part}"
 
             # Sanitize identifier for safe filename
-            safe_filename = re.sub(r'[^a-zA-Z0-9_-]', '_', identifier)
+            safe_filename = _UNSAFE_RE.sub('_', identifier)
             
             # Ensure filename is not empty and not too long
             if not safe_filename or safe_filename == "_":
@@ -294,8 +434,9 @@ class WebScraperOrchestrator:
 
         # Save sections (JSON formatted for readability)
         try:
-            with open(sections_file_path, "w", encoding="utf-8") as f:
-                json.dump(sections, f, indent=2, ensure_ascii=False, default=str)
+            sections_file_path.write_bytes(
+                orjson.dumps(sections, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+            )
             logger.debug(f"Sections saved to {sections_file_path}")
         except Exception as e:
             logger.error(f"Failed to save sections for {url}: {e}")
@@ -326,7 +467,6 @@ class WebScraperOrchestrator:
 			encoding="utf-8",
 			content_type="text/html",
 			html=html,
-			text=text_only,
 			metadata={},
 		)
             
@@ -337,59 +477,26 @@ class WebScraperOrchestrator:
             url = fetch_result["url"]
             page_content = fetch_result["page_content"]
             
-            # Step 5: Process and structure page data
-            processed_content = process_content(page_content.html)
-            logger.debug(f"Content processed for {url}")
-
-            '''
-            # AI enhancement if enabled
-            if self.enable_ai:
-                try:
-                    entities = disambiguate_business_entities(
-                        processed_content.get("emails", []), 
-                        processed_content.get("phones", [])
-                    )
-                    strategy = generate_extraction_strategy(page_content.html)
-                    validation = validate_and_enhance(
-                        processed_content.get("emails", []), 
-                        processed_content.get("phones", [])
-                    )
-                    logger.debug(f"AI enhancement completed for {url}")
-                except Exception as e:
-                    logger.warning(f"AI enhancement failed for {url}: {e}")
-            
-            '''
+            lead_info = _extract_lead_info(page_content.html, url)
+            return self._enhance_and_build_lead(lead_info, url)
             
-            logger.debug(f"moved to step 6 towards extraction of lead information for {url}")
-
-            # Debug the cleaned_text to see what type it is
-            cleaned_text = processed_content.get("cleaned_text", "")
-            if isinstance(cleaned_text, dict):
-                print(f' cleaned_text keys = {list(cleaned_text.keys())}')
-
-            # Ensure cleaned_text is a string before passing it
-            if not isinstance(cleaned_text, str):
-                if isinstance(cleaned_text, dict):
-                    # Extract text content from the dict
-                    text_parts = []
-                    for key, value in cleaned_text.items():
-                        if isinstance(value, str):
-                            text_parts.append(value)
-                    cleaned_text = " ".join(text_parts) if text_parts else ""
-                else:
-                    cleaned_text = str(cleaned_text) if cleaned_text is not None else ""
-
-            # Step 6: Extract lead information with AI integration
-            lead_info = extract_lead_information(
-                page_content.html, 
-                cleaned_text, 
-                url,
-                sections=processed_content.get("sections", []),
-                structured_data=processed_content.get("structured_data", [])  # Pass structured data
-            )
-            lead_info["extraction_metadata"]["extraction_timestamp"] = datetime.now().isoformat()
-            logger.debug(f"Extract lead information for {url}")
+        except Exception as e:
+            logger.error(f"Failed to extract lead from {fetch_result.get('url', 'unknown')}: {e}")
+            return None
 
+    def _enhance_and_build_lead(self, lead_info: Dict[str, Any], url: str) -> Optional[LeadModel]:
+        """
+        Run the AI integration pipeline and data quality engine on extracted lead
+        information and convert it to a LeadModel
+        
+        Args:
+            lead_info: Result of _extract_lead_info for the URL
+            url: Source URL of the lead
+            
+        Returns:
+            LeadModel instance or None if conversion failed
+        """
+        try:
             # AI Integration Pipeline (Phases 3-4)
             lead_info["ai_leads"] = []
             if lead_info.get("ai_lead_info") or lead_info.get("structured_data_summary"):
@@ -450,86 +557,41 @@ class WebScraperOrchestrator:
             return lead_model
             
         except Exception as e:
-            logger.error(f"Failed to extract lead from {fetch_result.get('url', 'unknown')}: {e}")
+            logger.error(f"Failed to extract lead from {url}: {e}")
             return None
 
-    def detect_duplicate_lead(self, new_lead: LeadModel, existing_leads: List[LeadModel]) -> Optional[LeadModel]:
+    def detect_duplicate_lead(self, new_lead: LeadModel, *lead_iters: Iterable[LeadModel]) -> Optional[LeadModel]:
         """
         Detect if a lead is a duplicate based on multiple criteria
+        (shared email, shared phone, or same business name with a shared website)
+        
+        Args:
+            new_lead: Lead to check
+            lead_iters: One or more collections of known leads, searched in order
+            
         Returns:
         Existing duplicate lead if found, None otherwise
         """
+        new_keys = new_lead._dedup_keys
+        if not new_keys:
+            return None
         
-        def normalize_field(field):
-            """Helper function to normalize fields that might be strings or lists"""
-            if field is None:
-                return []
-            if isinstance(field, str):
-                return [field]
-            if isinstance(field, list):
-                return field
-            return []
-        
-        def get_emails(lead):
-            """Extract emails as a list of normalized strings"""
-            emails = normalize_field(lead.email)
-            return [email.lower().strip() for email in emails if email]
-        
-        def get_websites(lead):
-            """Extract websites as a list of normalized strings"""
-            websites = normalize_field(lead.website)
-            return [website.strip() for website in websites if website]
-        
-        def get_business_name(lead):
-            """Extract business name as a normalized string"""
-            business_name = lead.business_name
-            if isinstance(business_name, list):
-                # If it's a list, take the first non-empty item
-                business_name = next((name for name in business_name if name), None)
-            return business_name.lower().strip() if business_name else None
-
-        for existing_lead in existing_leads:
-            # Check for exact email match
-            new_emails = get_emails(new_lead)
-            existing_emails = get_emails(existing_lead)
-            
-            # Check if any email matches
-            if new_emails and existing_emails:
-                for new_email in new_emails:
-                    if new_email in existing_emails:
-                        return existing_lead
-            
-            # Check for exact phone match
-            if (new_lead.phone and existing_lead.phone):
-                # Handle phone as potential list
-                new_phones = normalize_field(new_lead.phone)
-                existing_phones = normalize_field(existing_lead.phone)
-                
-                for new_phone in new_phones:
-                    for existing_phone in existing_phones:
-                        if (new_phone and existing_phone and
-                            self._normalize_phone(new_phone) == self._normalize_phone(existing_phone)):
-                            return existing_lead
-            
-            # Check for business name + website combination
-            new_business_name = get_business_name(new_lead)
-            existing_business_name = get_business_name(existing_lead)
-            new_websites = get_websites(new_lead)
-            existing_websites = get_websites(existing_lead)
-            
-            if (new_business_name and existing_business_name and
-                new_websites and existing_websites and
-                new_business_name == existing_business_name):
-                # Check if any website matches
-                for new_website in new_websites:
-                    if new_website in existing_websites:
-                        return existing_lead
+        for existing_lead in itertools.chain.from_iterable(lead_iters):
+            if not new_keys.isdisjoint(existing_lead._dedup_keys):
+                return existing_lead
         
         return None
-
-    def _normalize_phone(self, phone: str) -> str:
-        """Normalize phone number for comparison"""
-        return ''.join(filter(str.isdigit, phone))
+    
+    @staticmethod
+    def _merge_unique(existing: List[Any], new: List[Any]) -> List[Any]:
+        """Append items from new that are not already in existing, preserving order"""
+        merged = list(existing)
+        seen = set(merged)
+        for item in new:
+            if item not in seen:
+                seen.add(item)
+                merged.append(item)
+        return merged
     
     def merge_duplicate_leads(self, existing_lead: LeadModel, new_lead: LeadModel) -> LeadModel:
         """
@@ -539,9 +601,9 @@ class WebScraperOrchestrator:
         new_data = new_lead.dict()
         
         # Merge data sources
-        merged_data["data_sources"] = list(set(
-            merged_data.get("data_sources", []) + new_data.get("data_sources", [])
-        ))
+        merged_data["data_sources"] = self._merge_unique(
+            merged_data.get("data_sources", []), new_data.get("data_sources", [])
+        )
         
         # Keep higher confidence scores and better data
         for field in ["email", "phone", "address", "website", "business_name"]:
@@ -553,12 +615,12 @@ class WebScraperOrchestrator:
                 merged_data["confidence_scores"][field] = new_confidence
         
         # Merge services and intent indicators
-        merged_data["services"] = list(set(
-            merged_data.get("services", []) + new_data.get("services", [])
-        ))
-        merged_data["intent_indicators"] = list(set(
-            merged_data.get("intent_indicators", []) + new_data.get("intent_indicators", [])
-        ))
+        merged_data["services"] = self._merge_unique(
+            merged_data.get("services", []), new_data.get("services", [])
+        )
+        merged_data["intent_indicators"] = self._merge_unique(
+            merged_data.get("intent_indicators", []), new_data.get("intent_indicators", [])
+        )
         
         # Use higher lead score
         if new_data.get("lead_score", 0) > merged_data.get("lead_score", 0):
@@ -571,78 +633,171 @@ class WebScraperOrchestrator:
         
         return LeadModel(**merged_data)
     
+    def _buffer_mongo_write(self, lead_dict: Dict[str, Any]):
+        """Queue a web lead for MongoDB, flushing when the buffer is full or stale"""
+        self._mongo_buffer.append(lead_dict)
+        if (len(self._mongo_buffer) >= self._mongo_flush_size or
+                time.monotonic() - self._mongo_last_flush >= self._mongo_flush_interval):
+            self._flush_mongo()
+    
+    def _flush_mongo(self):
+        """Write all buffered web leads to MongoDB in one batch insert"""
+        self._mongo_last_flush = time.monotonic()
+        if not self._mongo_buffer:
+            return
+        
+        buffered, self._mongo_buffer = self._mongo_buffer, []
+        try:
+            # The manager stamps scraped_at/source and handles duplicates and unencodable documents
+            result = self.mongodb_manager.insert_batch_leads(buffered, 'web')
+            logger.info(f"✅ Flushed web leads to MongoDB - Inserted: {result['success_count']}, "
+                        f"Duplicates: {result['duplicate_count']}, Failures: {result['failure_count']}")
+        except Exception as e:
+            logger.error(f"❌ Error saving to MongoDB: {e}")
+    
+    def _get_extraction_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool for CPU-bound content processing, creating it on first use.
+        Workers are started with forkserver (spawn where unavailable) rather than fork,
+        since fetch threads and their Playwright loops are alive when the pool starts.
+        """
+        if self._extraction_pool is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._extraction_pool = ProcessPoolExecutor(
+                max_workers=self.extraction_workers,
+                mp_context=multiprocessing.get_context(start_method)
+            )
+        return self._extraction_pool
+    
+    def _shutdown_extraction_pool(self):
+        """Stop the content processing workers; the next batch starts a fresh pool"""
+        if self._extraction_pool is not None:
+            self._extraction_pool.shutdown()
+            self._extraction_pool = None
+    
+    def _record_lead(self, lead: LeadModel, url: str, existing_leads: List[LeadModel], successful_leads: List[LeadModel]):
+        """Merge a newly extracted lead into an existing duplicate or accept it into successful_leads"""
+        # Check for duplicates
+        duplicate = self.detect_duplicate_lead(lead, existing_leads, successful_leads)
+        if duplicate:
+            logger.info(f"Duplicate lead detected for {url}, merging with existing")
+            merged_lead = self.merge_duplicate_leads(duplicate, lead)
+            
+            # Update in successful_leads if it's there, otherwise update existing
+            idx = self._accepted_by_id.get(id(duplicate))
+            if idx is not None:
+                successful_leads[idx] = merged_lead
+                del self._accepted_by_id[id(duplicate)]
+                self._accepted_by_id[id(merged_lead)] = idx
+            else:
+                # Update existing lead in storage
+                self.storage.save_lead(merged_lead)
+                
+                # Save to MongoDB if enabled
+                if self.use_mongodb:
+                    try:
+                        lead_dict = merged_lead.dict()
+                        lead_dict['domain'] = urlparse(merged_lead.source_url).netloc
+                        self._buffer_mongo_write(lead_dict)
+                    except Exception as e:
+                        logger.error(f"❌ Error saving to MongoDB: {e}")
+            
+            self.duplicate_leads.append({
+                "original_url": duplicate.source_url,
+                "duplicate_url": url,
+                "merge_timestamp": datetime.now().isoformat()
+            })
+        else:
+            self._accepted_by_id[id(lead)] = len(successful_leads)
+            successful_leads.append(lead)
+    
     def process_urls_batch(self, urls: List[str]) -> Tuple[List[LeadModel], List[Dict[str, Any]]]:
         """
         Process a batch of URLs with concurrent execution
         
+        Fetching and AI calls run in a thread pool, while content processing and
+        lead extraction run in a separate process pool so that fetch concurrency
+        is not bound by CPU-heavy parsing under the GIL.
+        
         Returns:
             Tuple of (successful_leads, failed_urls)
         """
+        existing_leads = self.storage.load_all_leads()
+        self._accepted_by_id = {}
+        # A pool created here is owned by this call; run_complete_pipeline keeps one across batches
+        owns_pool = self._extraction_pool is None
+        extraction_pool = self._get_extraction_pool()
+        
+        try:
+            successful_leads, failed_urls = self._run_batch(urls, extraction_pool, existing_leads)
+        finally:
+            if owns_pool:
+                self._shutdown_extraction_pool()
+        
+        return successful_leads, failed_urls
+    
+    def _run_batch(self, urls: List[str], extraction_pool: ProcessPoolExecutor,
+                   existing_leads: List[LeadModel]) -> Tuple[List[LeadModel], List[Dict[str, Any]]]:
+        """Fetch, extract and build leads for one batch of URLs; see process_urls_batch"""
         successful_leads = []
         failed_urls = []
-        existing_leads = self.storage.load_all_leads()
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all URL processing tasks
-            future_to_url = {
-                executor.submit(self.classify_and_fetch_content, url): url 
+            # Submit all URL processing tasks; each pending future maps to its (stage, url)
+            pending = {
+                executor.submit(self.classify_and_fetch_content, url): ("fetch", url)
                 for url in urls if url not in self.processed_urls
             }
             
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
                 
-                try:
-                    # Add delay to avoid rate limiting
-                    time.sleep(self.delay_between_requests)
-                    
-                    fetch_result = future.result()
-                    if not fetch_result:
-                        failed_urls.append({"url": url, "error": "Failed to fetch content"})
-                        continue
+                for future in done:
+                    stage, url = pending.pop(future)
                     
-                    # Extract lead information
-                    lead = self.process_and_extract_leads(fetch_result)
-                    if not lead:
-                        failed_urls.append({"url": url, "error": "Failed to extract lead"})
-                        continue
-                    
-                    # Check for duplicates
-                    duplicate = self.detect_duplicate_lead(lead, existing_leads + successful_leads)
-                    if duplicate:
-                        logger.info(f"Duplicate lead detected for {url}, merging with existing")
-                        merged_lead = self.merge_duplicate_leads(duplicate, lead)
+                    try:
+                        if stage == "fetch":
+                            # Add delay to avoid rate limiting
+                            time.sleep(self.delay_between_requests)
+                            
+                            fetch_result = future.result()
+                            if not fetch_result:
+                                failed_urls.append({"url": url, "error": "Failed to fetch content"})
+                                continue
+                            
+                            # Process content and extract lead information in the process pool
+                            extract_future = extraction_pool.submit(_extract_lead_info, fetch_result["page_content"].html, url)
+                            pending[extract_future] = ("extract", url)
+                        
+                        elif stage == "extract":
+                            try:
+                                lead_info = future.result()
+                            except Exception as e:
+                                logger.error(f"Failed to extract lead from {url}: {e}")
+                                failed_urls.append({"url": url, "error": "Failed to extract lead"})
+                                continue
+                            
+                            # AI calls are network-bound, so they go back to the thread pool
+                            pending[executor.submit(self._enhance_and_build_lead, lead_info, url)] = ("build", url)
                         
-                        # Update in successful_leads if it's there, otherwise update existing
-                        if duplicate in successful_leads:
-                            idx = successful_leads.index(duplicate)
-                            successful_leads[idx] = merged_lead
                         else:
-                            # Update existing lead in storage
-                            self.storage.save_lead(merged_lead)
+                            lead = future.result()
+                            if not lead:
+                                failed_urls.append({"url": url, "error": "Failed to extract lead"})
+                                continue
                             
-                            # Save to MongoDB if enabled
-                            if self.use_mongodb:
-                                try:
-                                    lead_dict = merged_lead.dict()
-                                    lead_dict['domain'] = urlparse(merged_lead.source_url).netloc
-                                    self.mongodb_manager.insert_web_lead(lead_dict)
-                                except Exception as e:
-                                    logger.error(f"❌ Error saving to MongoDB: {e}")
+                            self._record_lead(lead, url, existing_leads, successful_leads)
+                            self.processed_urls.add(url)
                         
-                        self.duplicate_leads.append({
-                            "original_url": duplicate.source_url,
-                            "duplicate_url": url,
-                            "merge_timestamp": datetime.now().isoformat()
-                        })
-                    else:
-                        successful_leads.append(lead)
-                    
-                    self.processed_urls.add(url)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {url}: {e}")
-                    failed_urls.append({"url": url, "error": str(e)})
+                    except Exception as e:
+                        logger.error(f"Error processing {url}: {e}")
+                        failed_urls.append({"url": url, "error": str(e)})
+        
+        # Worker threads are gone once the pool exits, so release their browsers
+        self._close_dynamic_sessions()
+        
+        if self.use_mongodb:
+            self._flush_mongo()
         
         return successful_leads, failed_urls
     
@@ -669,88 +824,108 @@ class WebScraperOrchestrator:
                 # Use the storage directory
                 final_leads_path = Path(self.storage.storage_path) / "final_leads.json"
             
-            # Create final leads structure
-            final_leads = []
-            processed_urls = set()
-            
+            # Keep the first lead per source URL (avoid duplicates)
+            unique_leads: Dict[str, LeadModel] = {}
             for lead in all_successful_leads:
-                source_url = lead.source_url
-                
-                # Skip if we've already processed this URL (avoid duplicates)
-                if source_url in processed_urls:
-                    logger.debug(f"Skipping duplicate URL: {source_url}")
-                    continue
-                
-                processed_urls.add(source_url)
-                
-                # Create the main lead entry
-                main_lead = self._create_final_lead_entry(lead)
-                final_leads.append(main_lead)
-                
-                # Create additional leads from AI contacts if they represent different entities
-                if lead.ai_leads:
-                    for i, ai_lead in enumerate(lead.ai_leads):
-                        if isinstance(ai_lead, dict):
-                            # Process AI contacts if they exist
-                            ai_contacts = ai_lead.get("ai_contacts", [])
-                            if ai_contacts:
-                                for j, contact in enumerate(ai_contacts):
-                                    # Check if contact has meaningful data (name, email, or phone)
-                                    has_name = contact.get("name") and contact.get("name") != main_lead["contact_person"]
-                                    has_email = contact.get("email") and contact.get("email") != main_lead["email"]
-                                    has_phone = contact.get("phone") and contact.get("phone") != main_lead["phone"]
-                                    
-                                    if has_name or has_email or has_phone:
-                                        # Create a new lead for this contact
-                                        additional_lead = self._create_final_lead_entry(lead, ai_lead, contact)
-                                        additional_lead["id"] = f"{lead.id}_contact_{j}"
-                                        additional_lead["contact_person"] = contact.get("name") or main_lead["contact_person"]
-                                        additional_lead["email"] = contact.get("email") or main_lead["email"]
-                                        additional_lead["phone"] = contact.get("phone") or main_lead["phone"]
-                                        final_leads.append(additional_lead)
-                            
-                            # Also check if there's valuable organization_info even without contacts
-                            org_info = ai_lead.get("organization_info", {})
-                            if org_info and (org_info.get("primary_name") or org_info.get("industry") or org_info.get("services")):
-                                # Only create org lead if it's different from main lead
-                                org_name = org_info.get("primary_name")
-                                if org_name and org_name != main_lead.get("business_name"):
-                                    # Create a lead based on organization info
-                                    org_lead = self._create_final_lead_entry(lead, ai_lead)
-                                    org_lead["id"] = f"{lead.id}_org_{i}"
-                                    org_lead["business_name"] = org_name
-                                    org_lead["contact_person"] = main_lead["contact_person"]  # Keep original contact
-                                    org_lead["email"] = main_lead["email"]
-                                    org_lead["phone"] = main_lead["phone"]
-                                    final_leads.append(org_lead)
+                unique_leads.setdefault(lead.source_url, lead)
+            if len(unique_leads) < len(all_successful_leads):
+                logger.debug(f"Skipped {len(all_successful_leads) - len(unique_leads)} leads with duplicate URLs")
             
-            # Create the final structure
-            final_data = {
-                "leads": final_leads,
-                "metadata": {
-                    "generated_timestamp": datetime.now().isoformat(),
-                    "total_leads": len(final_leads),
-                    "source_file": str(export_path) if export_path else "pipeline_generated",
-                    "generated_by": "WebScraperOrchestrator",
-                    "traditional_leads": len([l for l in final_leads if not l["id"].endswith(("_ai_", "_contact_"))]),
-                    "ai_extracted_leads": len([l for l in final_leads if l["id"].endswith(("_ai_", "_contact_"))])
-                }
+            # Expand each unique lead into its main entry plus any AI-derived entries
+            final_leads = list(itertools.chain.from_iterable(
+                self._expand_final_lead_entries(lead) for lead in unique_leads.values()
+            ))
+            
+            # Every unique lead yields exactly one main entry; the rest are AI-derived
+            traditional_count = len(unique_leads)
+            ai_count = len(final_leads) - traditional_count
+            
+            # Create the final metadata
+            metadata = {
+                "generated_timestamp": datetime.now().isoformat(),
+                "total_leads": traditional_count + ai_count,
+                "source_file": str(export_path) if export_path else "pipeline_generated",
+                "generated_by": "WebScraperOrchestrator",
+                "traditional_leads": traditional_count,
+                "ai_extracted_leads": ai_count
             }
             
             # Save to file
-            final_leads_path.parent.mkdir(parents=True, exist_ok=True)
+            parent_dir = str(final_leads_path.parent)
+            if parent_dir not in self._ensured_dirs:
+                final_leads_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(parent_dir)
             
-            with open(final_leads_path, 'w', encoding='utf-8') as f:
-                json.dump(final_data, f, indent=2, ensure_ascii=False, default=str)
+            # Stream the document lead by lead so the encoded output is never held in full;
+            # a 1 MiB buffer coalesces the per-lead chunks into few write() syscalls
+            with open(final_leads_path, 'wb', buffering=1 << 20) as f:
+                f.writelines(_iter_final_json(final_leads, metadata))
             
             logger.info(f"Final leads saved to: {final_leads_path}")
-            return str(final_leads_path), final_data["leads"]
+            return str(final_leads_path), final_leads
             
         except Exception as e:
             logger.error(f"Failed to generate final leads: {e}")
             return None
     
-    def _create_final_lead_entry(self, lead: LeadModel, ai_lead_data: Dict[str, Any] = None, contact: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _expand_final_lead_entries(self, lead: LeadModel) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the main final lead entry for a lead, followed by any entries derived
+        from its AI contacts and organization info
+        """
+        # Overall confidence is shared by every entry derived from this lead
+        overall_confidence = self._calculate_overall_confidence(lead.confidence_scores)
+        
+        # Create the main lead entry
+        main_lead = self._create_final_lead_entry(lead, precomputed_confidence=overall_confidence)
+        yield main_lead
+        
+        main_contact_person = main_lead["contact_person"]
+        main_email = main_lead["email"]
+        main_phone = main_lead["phone"]
+        
+        # Create additional leads from AI contacts if they represent different entities
+        if lead.ai_leads:
+            for i, ai_lead in enumerate(lead.ai_leads):
+                if isinstance(ai_lead, dict):
+                    # Process AI contacts if they exist
+                    ai_contacts = ai_lead.get("ai_contacts", [])
+                    if ai_contacts:
+                        for j, contact in enumerate(ai_contacts):
+                            # Check if contact has meaningful data (name, email, or phone)
+                            name = contact.get("name")
+                            email = contact.get("email")
+                            phone = contact.get("phone")
+                            has_name = name and name != main_contact_person
+                            has_email = email and email != main_email
+                            has_phone = phone and phone != main_phone
+                            
+                            if has_name or has_email or has_phone:
+                                # Create a new lead for this contact
+                                additional_lead = self._create_final_lead_entry(lead, ai_lead, contact, precomputed_confidence=overall_confidence)
+                                additional_lead["id"] = f"{lead.id}_contact_{j}"
+                                additional_lead["contact_person"] = name or main_contact_person
+                                additional_lead["email"] = email or main_email
+                                additional_lead["phone"] = phone or main_phone
+                                yield additional_lead
+                    
+                    # Also check if there's valuable organization_info even without contacts
+                    org_info = ai_lead.get("organization_info") or _EMPTY
+                    if org_info and (org_info.get("primary_name") or org_info.get("industry") or org_info.get("services")):
+                        # Only create org lead if it's different from main lead
+                        org_name = org_info.get("primary_name")
+                        if org_name and org_name != main_lead.get("business_name"):
+                            # Create a lead based on organization info
+                            org_lead = self._create_final_lead_entry(lead, ai_lead, precomputed_confidence=overall_confidence)
+                            org_lead["id"] = f"{lead.id}_org_{i}"
+                            org_lead["business_name"] = org_name
+                            org_lead["contact_person"] = main_contact_person  # Keep original contact
+                            org_lead["email"] = main_email
+                            org_lead["phone"] = main_phone
+                            yield org_lead
+    
+    def _create_final_lead_entry(self, lead: LeadModel, ai_lead_data: Dict[str, Any] = None, contact: Dict[str, Any] = None,
+                                 precomputed_confidence: Optional[float] = None) -> Dict[str, Any]:
         """
         Create a final lead entry by merging traditional and AI data
         
@@ -758,11 +933,15 @@ class WebScraperOrchestrator:
             lead: LeadModel from traditional extraction
             ai_lead_data: AI lead data (optional)
             contact: Specific contact from AI data (optional)
+            precomputed_confidence: Overall confidence of the lead, if already calculated (optional)
             
         Returns:
             Formatted lead entry for final_leads.json
         """
         
+        if precomputed_confidence is None:
+            precomputed_confidence = self._calculate_overall_confidence(lead.confidence_scores)
+        
         # Start with traditional data
         final_lead = {
             "id": lead.id,
@@ -773,30 +952,42 @@ class WebScraperOrchestrator:
             "phone": lead.phone,
             "address": None,  # Will be populated from AI leads only
             "website": lead.website,
-            "social_media": lead.social_media,
+            # Stringify profiles up front so the JSON encoder never needs a fallback
+            "social_media": {platform: str(profile) for platform, profile in lead.social_media.items()},
             "industry": lead.industry,
             "services": lead.services or [],
-            "confidence_score": self._calculate_overall_confidence(lead.confidence_scores)
+            "confidence_score": precomputed_confidence
         }
         
         # Merge AI lead data if available
         if ai_lead_data:
             # Update address from AI leads only (as per requirements)
-            if ai_lead_data.get("addresses"):
-                # Take the highest confidence address
-                best_address = max(ai_lead_data["addresses"], 
-                                 key=lambda x: x.get("confidence", 0))
+            addresses = ai_lead_data.get("addresses")
+            if addresses:
+                # Take the highest confidence address (first one wins ties)
+                best_address = None
+                best_confidence = None
+                for address in addresses:
+                    confidence = address.get("confidence", 0)
+                    if best_address is None or confidence > best_confidence:
+                        best_address = address
+                        best_confidence = confidence
                 final_lead["address"] = best_address.get("address")
             
+            org_info = ai_lead_data.get("organization_info") or _EMPTY
+            
             # Update industry if AI found one
-            if ai_lead_data.get("organization_info", {}).get("industry"):
-                final_lead["industry"] = ai_lead_data["organization_info"]["industry"]
+            if org_info.get("industry"):
+                final_lead["industry"] = org_info["industry"]
             
-            # Update services if AI found any
-            if ai_lead_data.get("organization_info", {}).get("services"):
-                ai_services = ai_lead_data["organization_info"]["services"]
-                existing_services = set(final_lead["services"])
-                final_lead["services"] = list(existing_services.union(set(ai_services)))
+            # Update services if AI found any; nothing is allocated on the common no-services path
+            ai_services = org_info.get("services")
+            if ai_services:
+                # AI output is free-form, so coerce non-string entries to keep them hashable
+                final_lead["services"] = list(dict.fromkeys(itertools.chain(
+                    final_lead["services"],
+                    (service if isinstance(service, str) else str(service) for service in ai_services)
+                )))
         
         return final_lead
     
@@ -805,74 +996,78 @@ class WebScraperOrchestrator:
         if not confidence_scores:
             return 0.5  # Default confidence
         
-        scores = list(confidence_scores.values())
-        return sum(scores) / len(scores) if scores else 0.5
+        total = 0.0
+        count = 0
+        for score in confidence_scores.values():
+            total += score
+            count += 1
+        return total / count
 
-    def _transform_web_final_to_unified(self, lead: Dict[str, Any], icp_identifier: str = 'default') -> Optional[Dict[str, Any]]:
-        """Transform final web lead entry to unified schema (local to scraper)."""
-        try:
-            url = lead.get('source_url') or lead.get('website') or ''
-            if not url:
-                return None
-            emails = []
-            if lead.get('email'):
-                if isinstance(lead['email'], list):
-                    emails = [e for e in lead['email'] if e]
-                else:
-                    emails = [lead['email']]
-            phones = []
-            if lead.get('phone'):
-                if isinstance(lead['phone'], list):
-                    phones = [p for p in lead['phone'] if p]
-                else:
-                    phones = [lead['phone']]
-            unified = {
-                "url": url,
-                "platform": "web",
-                "content_type": "profile",
-                "source": "web-scraper",
-                "icp_identifier": icp_identifier,
-                "profile": {
-                    "username": "",
-                    "full_name": lead.get('business_name') or lead.get('contact_person') or "",
-                    "bio": "",
-                    "location": lead.get('address') or "",
-                    "job_title": "",
-                    "employee_count": ""
-                },
-                "contact": {
-                    "emails": emails,
-                    "phone_numbers": phones,
-                    "address": lead.get('address') or "",
-                    "websites": [url] if url else [],
-                    "social_media_handles": lead.get('social_media') or {},
-                    "bio_links": []
-                },
-                "content": {
-                    "caption": "",
-                    "upload_date": "",
-                    "channel_name": "",
-                    "author_name": ""
-                },
-                "metadata": {
-                    "scraped_at": datetime.utcnow().isoformat(),
-                    "data_quality_score": f"{self._calculate_overall_confidence(lead.get('confidence_scores', {})):.2f}"
-                },
-                "industry": lead.get('industry'),
-                "revenue": None,
-                "lead_category": None,
-                "lead_sub_category": None,
-                "company_name": lead.get('business_name') or "",
-                "company_type": None,
-                "decision_makers": lead.get('contact_person') or "",
-                "bdr": "AKG",
-                "product_interests": None,
-                "timeline": None,
-                "interest_level": None
-            }
-            return unified
-        except Exception:
+    def _transform_web_final_to_unified(self, lead: Dict[str, Any], icp_identifier: str = 'default', scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Transform final web lead entry to unified schema (local to scraper).
+        
+        scraped_at lets batch callers share one timestamp instead of reading the clock per lead.
+        """
+        if not isinstance(lead, dict):
+            return None
+        url = lead.get('source_url') or lead.get('website') or ''
+        if not url:
             return None
+        
+        email = lead.get('email')
+        emails = [e for e in email if e] if isinstance(email, list) else ([email] if email else [])
+        phone = lead.get('phone')
+        phones = [p for p in phone if p] if isinstance(phone, list) else ([phone] if phone else [])
+        
+        confidence_scores = lead.get('confidence_scores')
+        if not isinstance(confidence_scores, dict):
+            confidence_scores = {}
+        
+        unified = {
+            "url": url,
+            "platform": "web",
+            "content_type": "profile",
+            "source": "web-scraper",
+            "icp_identifier": icp_identifier,
+            "profile": {
+                "username": "",
+                "full_name": lead.get('business_name') or lead.get('contact_person') or "",
+                "bio": "",
+                "location": lead.get('address') or "",
+                "job_title": "",
+                "employee_count": ""
+            },
+            "contact": {
+                "emails": emails,
+                "phone_numbers": phones,
+                "address": lead.get('address') or "",
+                "websites": [url] if url else [],
+                "social_media_handles": lead.get('social_media') or {},
+                "bio_links": []
+            },
+            "content": {
+                "caption": "",
+                "upload_date": "",
+                "channel_name": "",
+                "author_name": ""
+            },
+            "metadata": {
+                "scraped_at": scraped_at or datetime.utcnow().isoformat(),
+                "data_quality_score": f"{self._calculate_overall_confidence(confidence_scores):.2f}"
+            },
+            "industry": lead.get('industry'),
+            "revenue": None,
+            "lead_category": None,
+            "lead_sub_category": None,
+            "company_name": lead.get('business_name') or "",
+            "company_type": None,
+            "decision_makers": lead.get('contact_person') or "",
+            "bdr": "AKG",
+            "product_interests": None,
+            "timeline": None,
+            "interest_level": None
+        }
+        return unified
 
     def run_complete_pipeline(self, 
                             urls: List[str] = None,
@@ -881,7 +1076,8 @@ class WebScraperOrchestrator:
                             export_format: str = "json",
                             export_path: str = None,
                             generate_final_leads: bool = True,
-                            icp_identifier: str = 'default') -> Dict[str, Any]:
+                            icp_identifier: str = 'default',
+                            build_unified: bool = False) -> Dict[str, Any]:
         """
         Run the complete pipeline from URLs to exported leads
         
@@ -893,6 +1089,7 @@ class WebScraperOrchestrator:
             export_path: Path for exported file
             generate_final_leads: Whether to generate final leads JSON
             icp_identifier: ICP identifier for tracking which ICP this data belongs to
+            build_unified: Whether to build unified-schema leads for the "unified_leads" result
             
         Returns:
             Dictionary with pipeline results and statistics
@@ -912,25 +1109,34 @@ class WebScraperOrchestrator:
         logger.info(f"Processing {len(urls)} URLs in batches of {batch_size}")
         
         all_successful_leads = []
+        all_successful_lead_dicts = []
         all_failed_urls = []
         
-        # Process URLs in batches
-        for i in range(0, len(urls), batch_size):
-            batch_urls = urls[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            
-            logger.info(f"Processing batch {batch_num}/{(len(urls) + batch_size - 1) // batch_size}")
-            
-            successful_leads, failed_urls = self.process_urls_batch(batch_urls)
-            
-            # Save successful leads to storage
-            if successful_leads:
-                self.storage.save_leads_batch(successful_leads)
-                all_successful_leads.extend(successful_leads)
-            
-            all_failed_urls.extend(failed_urls)
-            
-            logger.info(f"Batch {batch_num} completed: {len(successful_leads)} successful, {len(failed_urls)} failed")
+        # One process pool serves every batch of this run and is shut down when the run ends
+        self._get_extraction_pool()
+        try:
+            # Process URLs in batches
+            for i in range(0, len(urls), batch_size):
+                batch_urls = urls[i:i + batch_size]
+                batch_num = i // batch_size + 1
+                
+                logger.info(f"Processing batch {batch_num}/{(len(urls) + batch_size - 1) // batch_size}")
+                
+                successful_leads, failed_urls = self.process_urls_batch(batch_urls)
+                
+                # Save successful leads to storage
+                if successful_leads:
+                    # Dump each model once and reuse it for storage and the returned stats
+                    lead_dicts = [lead.model_dump() for lead in successful_leads]
+                    self.storage.save_leads_batch(successful_leads, lead_dicts)
+                    all_successful_leads.extend(successful_leads)
+                    all_successful_lead_dicts.extend(lead_dicts)
+                
+                all_failed_urls.extend(failed_urls)
+                
+                logger.info(f"Batch {batch_num} completed: {len(successful_leads)} successful, {len(failed_urls)} failed")
+        finally:
+            self._shutdown_extraction_pool()
         
         # Export results if requested
         exported_file = None
@@ -951,27 +1157,29 @@ class WebScraperOrchestrator:
                 result = self.generate_final_leads(all_successful_leads, export_path)
                 if result:
                     final_leads_file, final_leads = result  # unpack (path, leads)
+                    final_leads = [lead if isinstance(lead, dict) else lead.dict() for lead in final_leads]
                     logger.info(f"Final leads generated: {final_leads_file} with {len(final_leads)} leads")
             except Exception as e:
                 logger.error(f"Final leads generation failed: {e}")
         
-        # Build unified leads locally from final leads and save
+        # Build unified leads locally from final leads, only for callers that consume them
         unified_leads = []
-        for lead in final_leads:
-            lead_dict = lead if isinstance(lead, dict) else lead.dict()
-            u = self._transform_web_final_to_unified(lead_dict, icp_identifier)
-            if u:
-                unified_leads.append(u)
+        if build_unified:
+            scraped_at = datetime.utcnow().isoformat()
+            for lead_dict in final_leads:
+                u = self._transform_web_final_to_unified(lead_dict, icp_identifier, scraped_at=scraped_at)
+                if u:
+                    unified_leads.append(u)
                 
         # Save to MongoDB if enabled
-        if self.use_mongodb:
+        if self.use_mongodb and final_leads:
             try:
-                # Save original web leads (optional)
+                # Save original web leads (optional), inserted with a single bulk op
                 web_leads_data = []
-                for lead in final_leads:
-                    lead_dict = lead if isinstance(lead, dict) else lead.dict()
-                    if lead_dict.get('source_url'):
-                        lead_dict['domain'] = urlparse(lead_dict['source_url']).netloc
+                for lead_dict in final_leads:
+                    source_url = lead_dict.get('source_url')
+                    if source_url:
+                        lead_dict['domain'] = urlsplit(source_url).netloc
                     lead_dict['icp_identifier'] = icp_identifier
                     web_leads_data.append(lead_dict)
                 if web_leads_data:
@@ -999,7 +1207,7 @@ class WebScraperOrchestrator:
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat()
             },
-            "successful_leads": [lead.dict() for lead in all_successful_leads],
+            "successful_leads": all_successful_lead_dicts,
             "failed_urls": all_failed_urls,
             "duplicate_info": self.duplicate_leads,
             "exported_file": exported_file,
@@ -1075,6 +1283,8 @@ def main():
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
         raise
+    finally:
+        orchestrator.close()
 
 
 if __name__ == "__main__":
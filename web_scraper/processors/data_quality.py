@@ -2,17 +2,168 @@ from __future__ import annotations
 
 import re
 import json
-from typing import Any, Dict, List, Optional, Tuple, Set
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Set
 from urllib.parse import urlparse
 from datetime import datetime, timezone
 import math
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
 from loguru import logger
 
 try:
-    from fuzzywuzzy import fuzz  # type: ignore
-    _HAS_FUZZYWUZZY = True
+    from rapidfuzz import fuzz  # type: ignore
+    _HAS_RAPIDFUZZ = True
 except ImportError:
-    _HAS_FUZZYWUZZY = False
+    _HAS_RAPIDFUZZ = False
+
+_ADDRESS_ABBREVIATIONS = {
+    'street': 'st', 'avenue': 'ave', 'road': 'rd',
+    'boulevard': 'blvd', 'lane': 'ln', 'drive': 'dr',
+    'court': 'ct', 'place': 'pl', 'apartment': 'apt'
+}
+_ADDRESS_ABBREVIATION_RE = re.compile(r'\b(' + '|'.join(_ADDRESS_ABBREVIATIONS) + r')\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ADDRESS_PUNCT_RE = re.compile(r'[^\w\s\-]')
+_STREET_NUMBER_RE = re.compile(r'\d+')
+# fuzz.ratio fraction at which two normalized addresses count as the same place
+_ADDRESS_SIMILARITY = 0.8
+# fuzzywuzzy rounded ratios to whole percents, so a raw score half a point below a
+# threshold still matched; raw-score bounds are widened by this much to keep that
+_ROUNDING_SLACK = 0.005
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Shared read-only fallbacks for missing sections; never mutate these
+_EMPTY_DICT: Dict[str, Any] = {}
+_EMPTY_LIST: List[Any] = []
+
+
+def _shared_gram_min_total(q: int, threshold: float) -> Optional[int]:
+    """
+    Smallest combined length at which two strings with fuzz.ratio >= threshold are
+    guaranteed to share a q-gram, or None if no length guarantees it.
+
+    A ratio of t means m >= t*S/2 matched characters and at most d <= (1-t)*S indels
+    for combined length S. The matched characters fall into at most d+1 runs that are
+    contiguous in both strings, and those runs hold at least m - (q-1)*(d+1) common
+    q-grams, which is positive once t*S/2 > (q-1)*((1-t)*S + 1).
+    """
+    coefficient = threshold / 2 - (q - 1) * (1 - threshold)
+    # The small epsilons keep float rounding from claiming a guarantee at the boundary
+    if coefficient <= 1e-9:
+        return None
+    return math.floor((q - 1) / coefficient + 1e-9) + 1
+
+
+def _shared_gram_lower_bound(total: int, q: int, threshold: float) -> int:
+    """
+    Fewest q-gram occurrences two strings of combined length `total` must share to reach
+    fuzz.ratio >= threshold: m - (q-1)*(d+1) with m = ceil(threshold*total/2) matched
+    characters and d = total - 2m indels (see _shared_gram_min_total).
+    """
+    matched = math.ceil(threshold * total / 2 - 1e-9)
+    return matched * (2 * q - 1) - (q - 1) * (total + 1)
+
+
+def _ratio_meets(a: str, b: str, threshold: float) -> bool:
+    """True if fuzz.ratio of a and b, rounded to a whole percent as fuzzywuzzy did, reaches threshold."""
+    score = fuzz.ratio(a, b, score_cutoff=(threshold - _ROUNDING_SLACK) * 100)
+    return score > 0 and round(score) / 100.0 >= threshold
+
+
+def _contact_info(lead: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the lead's contact_information section, or an empty read-only dict."""
+    return lead.get('contact_information') or _EMPTY_DICT
+
+
+def _url_list(url: Any) -> List[str]:
+    """Return extraction_metadata['url'] as a list, whether it holds one URL or an already merged list."""
+    if not url:
+        return _EMPTY_LIST
+    return [url] if isinstance(url, str) else url
+
+
+def _first_value(items: Optional[List[Dict[str, Any]]], key: str) -> str:
+    """Return key from the first (primary) item of a contact list, or '' if the list is empty."""
+    return items[0].get(key, '') if items else ''
+
+
+@lru_cache(maxsize=4096)
+def _parse_extraction_epoch(timestamp_str: str) -> Optional[float]:
+    """Parse an extraction timestamp into a UTC epoch, or None if it cannot be parsed."""
+    try:
+        # Handle different timestamp formats more robustly
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str.replace('Z', '+00:00')
+        elif not timestamp_str.endswith(('+00:00', '-00:00')) and 'T' in timestamp_str:
+            # If no timezone info, assume UTC
+            timestamp_str += '+00:00'
+        
+        extraction_time = datetime.fromisoformat(timestamp_str)
+        
+        # Ensure extraction_time is timezone-aware
+        if extraction_time.tzinfo is None:
+            extraction_time = extraction_time.replace(tzinfo=timezone.utc)
+        
+        return extraction_time.timestamp()
+    except Exception:
+        return None
+
+
+class _DigitTable(dict):
+    """str.translate table that keeps decimal digits and deletes everything else.
+    
+    Code points are classified on first sight, so it matches re.sub(r'\\D', '', ...)
+    for any input without enumerating the whole Unicode range up front.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        self[codepoint] = keep = codepoint if chr(codepoint).isdecimal() else None
+        return keep
+
+
+_KEEP_DIGITS = _DigitTable()
+
+
+def _is_plausible_phone_digits(digits: str) -> bool:
+    """Check a digit string has a phone-like length and is not one repeated digit."""
+    # count() scans in C without building a set of one-character strings
+    return 7 <= len(digits) <= 15 and digits.count(digits[0]) != len(digits)
+
+
+@lru_cache(maxsize=65536)
+def _normalize_address_text(address: str) -> str:
+    """Lowercase, collapse whitespace, abbreviate street types and strip punctuation."""
+    normalized = _WHITESPACE_RE.sub(' ', address.lower().strip())
+    normalized = _ADDRESS_ABBREVIATION_RE.sub(lambda m: _ADDRESS_ABBREVIATIONS[m.group(1)], normalized)
+    # Remove punctuation except hyphens in ZIP codes
+    return _ADDRESS_PUNCT_RE.sub('', normalized)
+
+
+class _DisjointSet:
+    """Union-find over indices 0..n-1 with path compression and union by size."""
+    
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+    
+    def find(self, x: int) -> int:
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+    
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
 
 
 class LeadDeduplicator:
@@ -28,6 +179,10 @@ class LeadDeduplicator:
         if not leads:
             return []
         
+        # A single lead has nothing to be merged with
+        if len(leads) == 1:
+            return list(leads)
+        
         # Step 1: Exact match deduplication
         unique_leads = self._exact_match_deduplication(leads)
         logger.info(f"After exact match: {len(unique_leads)} leads")
@@ -44,46 +199,39 @@ class LeadDeduplicator:
     
     def _exact_match_deduplication(self, leads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove exact duplicates based on email, phone, website URL."""
-        seen_keys = set()
+        key_to_idx: Dict[str, int] = {}
         unique_leads = []
         
         for lead in leads:
             # Create composite key from primary identifiers
             key_parts = []
+            contact_info = _contact_info(lead)
             
             # Email key
-            emails = lead.get('contact_information', {}).get('emails', [])
-            if emails:
-                primary_email = emails[0].get('value', '').lower().strip()
-                if primary_email:
-                    key_parts.append(f"email:{primary_email}")
+            primary_email = _first_value(contact_info.get('emails'), 'value').lower().strip()
+            if primary_email:
+                key_parts.append(f"email:{primary_email}")
             
             # Phone key
-            phones = lead.get('contact_information', {}).get('phones', [])
-            if phones:
-                primary_phone = phones[0].get('clean_value', '').strip()
-                if primary_phone:
-                    key_parts.append(f"phone:{primary_phone}")
+            primary_phone = _first_value(contact_info.get('phones'), 'clean_value').strip()
+            if primary_phone:
+                key_parts.append(f"phone:{primary_phone}")
             
             # Website key
-            websites = lead.get('contact_information', {}).get('websites', [])
-            if websites:
-                primary_website = websites[0].get('domain', '').lower().strip()
-                if primary_website:
-                    key_parts.append(f"website:{primary_website}")
+            primary_website = _first_value(contact_info.get('websites'), 'domain').lower().strip()
+            if primary_website:
+                key_parts.append(f"website:{primary_website}")
             
             # Create composite key
             if key_parts:
                 composite_key = "|".join(sorted(key_parts))
-                if composite_key not in seen_keys:
-                    seen_keys.add(composite_key)
+                existing_idx = key_to_idx.get(composite_key)
+                if existing_idx is None:
+                    key_to_idx[composite_key] = len(unique_leads)
                     unique_leads.append(lead)
                 else:
                     # Merge with existing lead using confidence-based selection
-                    existing_idx = self._find_lead_index_by_key(unique_leads, composite_key)
-                    if existing_idx is not None:
-                        merged_lead = self._merge_leads(unique_leads[existing_idx], lead)
-                        unique_leads[existing_idx] = merged_lead
+                    unique_leads[existing_idx] = self._merge_leads(unique_leads[existing_idx], lead)
             else:
                 # No primary identifiers, keep as unique
                 unique_leads.append(lead)
@@ -92,125 +240,143 @@ class LeadDeduplicator:
     
     def _fuzzy_match_deduplication(self, leads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove fuzzy duplicates based on company names (85% similarity)."""
-        if not _HAS_FUZZYWUZZY:
-            logger.warning("fuzzywuzzy not available, skipping fuzzy deduplication")
+        if not _HAS_RAPIDFUZZ:
+            logger.warning("rapidfuzz not available, skipping fuzzy deduplication")
             return leads
         
-        unique_leads = []
-        processed_indices = set()
+        names = [(lead.get('business_information') or _EMPTY_DICT).get('company_name', '').strip().lower() for lead in leads]
         
-        for i, lead in enumerate(leads):
-            if i in processed_indices:
-                continue
-            
-            company_name = lead.get('business_information', {}).get('company_name', '').strip()
-            if not company_name or len(company_name) < 3:
-                unique_leads.append(lead)
-                continue
-            
-            # Find similar company names
-            similar_leads = [lead]
-            similar_indices = {i}
-            
-            for j, other_lead in enumerate(leads[i+1:], i+1):
-                if j in processed_indices:
-                    continue
-                
-                other_company = other_lead.get('business_information', {}).get('company_name', '').strip()
-                if not other_company:
-                    continue
-                
-                # Calculate similarity
-                similarity = fuzz.ratio(company_name.lower(), other_company.lower()) / 100.0
-                
-                if similarity >= self.similarity_threshold:
-                    similar_leads.append(other_lead)
-                    similar_indices.add(j)
-            
-            # Merge similar leads
-            if len(similar_leads) > 1:
-                merged_lead = self._merge_multiple_leads(similar_leads)
-                unique_leads.append(merged_lead)
-            else:
-                unique_leads.append(lead)
-            
-            processed_indices.update(similar_indices)
+        # Names this short cannot reach the threshold against anything but themselves; leave them out
+        names = [name if len(name) >= 3 else '' for name in names]
+        lengths = [len(name) for name in names]
+        threshold = self.similarity_threshold
+        # Lowest raw ratio that still rounds up to the threshold
+        raw_threshold = threshold - _ROUNDING_SLACK
         
-        return unique_leads
+        def is_match(i: int, j: int) -> bool:
+            # The ratio is at most 2*min/(len_a+len_b), so some pairs are ruled out by length alone
+            len_i, len_j = lengths[i], lengths[j]
+            if 2 * min(len_i, len_j) < raw_threshold * (len_i + len_j):
+                return False
+            return _ratio_meets(names[i], names[j], threshold)
+        
+        return self._merge_clusters(leads, self._candidate_pairs(names, raw_threshold), is_match)
     
     def _cross_reference_deduplication(self, leads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicates based on address normalization and matching."""
+        # Normalize each address and pull its street number once, outside the pair loop
+        normalized_addresses = []
+        street_numbers = []
+        for lead in leads:
+            normalized = self._normalize_address(_first_value(_contact_info(lead).get('addresses'), 'value'))
+            number = _STREET_NUMBER_RE.match(normalized)
+            normalized_addresses.append(normalized)
+            street_numbers.append(number.group() if number else '')
+        
+        def is_match(i: int, j: int) -> bool:
+            # Different street numbers can never match, so skip the fuzzy comparison
+            if street_numbers[i] and street_numbers[j] and street_numbers[i] != street_numbers[j]:
+                return False
+            return self._addresses_similar(normalized_addresses[i], normalized_addresses[j])
+        
+        return self._merge_clusters(leads, self._candidate_pairs(normalized_addresses, _ADDRESS_SIMILARITY - _ROUNDING_SLACK), is_match)
+    
+    def _merge_clusters(self, leads: List[Dict[str, Any]], candidates: Iterable[Tuple[int, int]],
+                        is_match: Callable[[int, int], bool]) -> List[Dict[str, Any]]:
+        """Union matching candidate pairs and merge each resulting cluster, keeping first-seen order."""
+        clusters = _DisjointSet(len(leads))
+        for i, j in candidates:
+            # Pairs already joined through another match need no comparison
+            if clusters.find(i) != clusters.find(j) and is_match(i, j):
+                clusters.union(i, j)
+        
+        members_by_root: Dict[int, List[int]] = defaultdict(list)
+        for i in range(len(leads)):
+            members_by_root[clusters.find(i)].append(i)
+        
         unique_leads = []
-        processed_indices = set()
+        for members in members_by_root.values():
+            if len(members) > 1:
+                unique_leads.append(self._merge_multiple_leads([leads[j] for j in members]))
+            else:
+                unique_leads.append(leads[members[0]])
         
-        for i, lead in enumerate(leads):
-            if i in processed_indices:
-                continue
-            
-            addresses = lead.get('contact_information', {}).get('addresses', [])
-            if not addresses:
-                unique_leads.append(lead)
+        return unique_leads
+    
+    def _gram_tokens(self, value: str, n: int) -> List[Tuple[str, int]]:
+        """Character n-grams of value, numbered per repeat so shared tokens count shared occurrences."""
+        seen: Dict[str, int] = defaultdict(int)
+        tokens = []
+        for k in range(len(value) - n + 1):
+            gram = value[k:k+n]
+            tokens.append((gram, seen[gram]))
+            seen[gram] += 1
+        return tokens
+    
+    def _candidate_pairs(self, values: List[str], threshold: float, max_n: int = 4) -> Iterator[Tuple[int, int]]:
+        """
+        Yield index pairs that could reach fuzz.ratio >= threshold, each pair once per gram size.
+
+        No qualifying pair is missed: each gram size n covers the pairs whose combined
+        length guarantees a shared n-gram (see _shared_gram_min_total), and only values
+        too short for the larger gram sizes are indexed by the smaller ones, down to
+        single characters. Pairs are produced lazily, so memory holds the gram index only.
+        """
+        # Values at least this long only pair within a larger gram size's guarantee
+        upper: Optional[int] = None
+        for n in range(max_n, 0, -1):
+            min_total = _shared_gram_min_total(n, threshold)
+            if min_total is None:
                 continue
-            
-            normalized_address = self._normalize_address(addresses[0].get('value', ''))
-            if not normalized_address:
-                unique_leads.append(lead)
+            indices = [idx for idx, value in enumerate(values)
+                       if len(value) >= n and (upper is None or len(value) < upper)]
+            yield from self._prefix_filtered_pairs(values, indices, n, threshold, min_total, upper)
+            upper = min_total
+    
+    def _prefix_filtered_pairs(self, values: List[str], indices: List[int], n: int, threshold: float,
+                               min_total: int, upper: Optional[int]) -> Iterator[Tuple[int, int]]:
+        """
+        Yield pairs among indices that share an n-gram within their prefixes.
+
+        A pair reaching the threshold shares at least _shared_gram_lower_bound tokens, so
+        with tokens ordered rarest first, the first len(tokens) - bound + 1 of each side
+        must overlap. Only those prefixes are indexed, which keeps common grams from
+        pairing everything with everything.
+        """
+        tokens_by_idx = {idx: self._gram_tokens(values[idx], n) for idx in indices}
+        frequency = Counter(token for tokens in tokens_by_idx.values() for token in tokens)
+        index: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        lengths = {idx: len(values[idx]) for idx in indices}
+        
+        for x in indices:
+            length = lengths[x]
+            # Partner lengths that can reach the threshold at all, limited to this gram size's range
+            shortest = max(n, math.ceil(length * threshold / (2 - threshold) - 1e-9))
+            longest = math.floor(length * (2 - threshold) / threshold + 1e-9)
+            if upper is not None:
+                longest = min(longest, upper - 1)
+            if max(min_total, length + shortest) > length + longest:
                 continue
+            bound = min(_shared_gram_lower_bound(total, n, threshold)
+                        for total in range(max(min_total, length + shortest), length + longest + 1))
             
-            # Find leads with similar addresses
-            similar_leads = [lead]
-            similar_indices = {i}
-            
-            for j, other_lead in enumerate(leads[i+1:], i+1):
-                if j in processed_indices:
-                    continue
-                
-                other_addresses = other_lead.get('contact_information', {}).get('addresses', [])
-                if not other_addresses:
-                    continue
-                
-                other_normalized = self._normalize_address(other_addresses[0].get('value', ''))
-                if not other_normalized:
-                    continue
-                
-                # Check address similarity
-                if self._addresses_similar(normalized_address, other_normalized):
-                    similar_leads.append(other_lead)
-                    similar_indices.add(j)
+            tokens = sorted(tokens_by_idx.pop(x), key=lambda token: (frequency[token], token))
+            prefix = tokens[:len(tokens) - bound + 1]
             
-            # Merge similar leads
-            if len(similar_leads) > 1:
-                merged_lead = self._merge_multiple_leads(similar_leads)
-                unique_leads.append(merged_lead)
-            else:
-                unique_leads.append(lead)
-            
-            processed_indices.update(similar_indices)
-        
-        return unique_leads
+            partners: Set[int] = set()
+            for token in prefix:
+                partners.update(index.get(token, ()))
+                index[token].append(x)
+            for y in partners:
+                if shortest <= lengths[y] <= longest:
+                    yield y, x
     
     def _normalize_address(self, address: str) -> str:
         """Normalize address for comparison."""
         if not address:
             return ""
         
-        # Convert to lowercase and remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', address.lower().strip())
-        
-        # Standardize common abbreviations
-        abbreviations = {
-            r'\bstreet\b': 'st', r'\bavenue\b': 'ave', r'\broad\b': 'rd',
-            r'\bboulevard\b': 'blvd', r'\blane\b': 'ln', r'\bdrive\b': 'dr',
-            r'\bcourt\b': 'ct', r'\bplace\b': 'pl', r'\bapartment\b': 'apt'
-        }
-        
-        for full_form, abbrev in abbreviations.items():
-            normalized = re.sub(full_form, abbrev, normalized)
-        
-        # Remove punctuation except hyphens in ZIP codes
-        normalized = re.sub(r'[^\w\s\-]', '', normalized)
-        
-        return normalized
+        return _normalize_address_text(address)
     
     def _addresses_similar(self, addr1: str, addr2: str) -> bool:
         """Check if two normalized addresses are similar."""
@@ -218,17 +384,21 @@ class LeadDeduplicator:
             return False
         
         # Extract street numbers
-        num1 = re.search(r'^\d+', addr1)
-        num2 = re.search(r'^\d+', addr2)
+        num1 = _STREET_NUMBER_RE.match(addr1)
+        num2 = _STREET_NUMBER_RE.match(addr2)
         
         # If different street numbers, not similar
         if num1 and num2 and num1.group() != num2.group():
             return False
         
+        # Lengths too far apart cannot reach the address similarity threshold
+        len1, len2 = len(addr1), len(addr2)
+        if 2 * min(len1, len2) < (_ADDRESS_SIMILARITY - _ROUNDING_SLACK) * (len1 + len2):
+            return False
+        
         # Check overall similarity
-        if _HAS_FUZZYWUZZY:
-            similarity = fuzz.ratio(addr1, addr2) / 100.0
-            return similarity >= 0.8
+        if _HAS_RAPIDFUZZ:
+            return _ratio_meets(addr1, addr2, _ADDRESS_SIMILARITY)
         else:
             return addr1 == addr2
     
@@ -238,14 +408,14 @@ class LeadDeduplicator:
         
         # Merge contact information
         merged['contact_information'] = self._merge_contact_info(
-            lead1.get('contact_information', {}),
-            lead2.get('contact_information', {})
+            _contact_info(lead1),
+            _contact_info(lead2)
         )
         
         # Merge business information - data completeness prioritization
         merged['business_information'] = self._merge_business_info(
-            lead1.get('business_information', {}),
-            lead2.get('business_information', {})
+            lead1.get('business_information') or _EMPTY_DICT,
+            lead2.get('business_information') or _EMPTY_DICT
         )
         
         # Merge intent indicators
@@ -254,14 +424,14 @@ class LeadDeduplicator:
         merged['intent_indicators'] = list(intent1.union(intent2))
         
         # Use higher lead score - source credibility weighting
-        score1 = lead1.get('lead_score', {}).get('total_score', 0)
-        score2 = lead2.get('lead_score', {}).get('total_score', 0)
-        merged['lead_score'] = lead1.get('lead_score', {}) if score1 >= score2 else lead2.get('lead_score', {})
+        lead_score1 = lead1.get('lead_score') or _EMPTY_DICT
+        lead_score2 = lead2.get('lead_score') or _EMPTY_DICT
+        merged['lead_score'] = dict(lead_score1 if lead_score1.get('total_score', 0) >= lead_score2.get('total_score', 0) else lead_score2)
         
         # Merge extraction metadata
         merged['extraction_metadata'] = self._merge_metadata(
-            lead1.get('extraction_metadata', {}),
-            lead2.get('extraction_metadata', {})
+            lead1.get('extraction_metadata') or _EMPTY_DICT,
+            lead2.get('extraction_metadata') or _EMPTY_DICT
         )
         
         return merged
@@ -310,33 +480,33 @@ class LeadDeduplicator:
     
     def _merge_contact_list(self, list1: List[Dict[str, Any]], list2: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
         """Merge two contact lists, removing duplicates."""
-        seen_values = set()
-        merged = []
-        
-        # Add items from both lists, preferring higher confidence
-        all_items = sorted(list1 + list2, key=lambda x: x.get('confidence', 0), reverse=True)
-        
-        for item in all_items:
-            value = item.get(key, '').lower().strip()
-
-            # Normalize based on field
-            if key == 'value' and '@' in value:  # email
-                value = value.lower()
-            elif key == 'clean_value':  # phone
-                digits = re.sub(r'\D', '', value)
-                if not (7 <= len(digits) <= 15 and len(set(digits)) > 1):
-                    continue  # skip invalid phones
-                value = digits
-            elif key == 'domain':  # website
-                value = value.lower()
-            elif key == 'value':
-                value = self._normalize_address(item.get(key, ''))
-
-            if value and value not in seen_values:
-                seen_values.add(value)
-                merged.append(item)
+        # Normalize based on field
+        if key == 'clean_value':  # phone
+            def normalize(raw: str) -> str:
+                digits = raw.translate(_KEEP_DIGITS)
+                # Invalid phones normalize to nothing and are skipped
+                return digits if _is_plausible_phone_digits(digits) else ''
+        elif key == 'value':  # email or address
+            def normalize(raw: str) -> str:
+                value = raw.lower().strip()
+                return value if '@' in value else self._normalize_address(raw)
+        else:  # website domain, social media url
+            def normalize(raw: str) -> str:
+                return raw.lower().strip()
+        
+        # Keep the highest-confidence item per value (earliest wins ties) in a single pass
+        best: Dict[str, Tuple[float, int, Dict[str, Any]]] = {}
+        for position, item in enumerate(chain(list1, list2)):
+            value = normalize(item.get(key, ''))
+            if not value:
+                continue
+            confidence = item.get('confidence', 0)
+            current = best.get(value)
+            if current is None or confidence > current[0]:
+                best[value] = (confidence, position, item)
         
-        return merged
+        # Order by confidence, then by original position, as the previous stable sort did
+        return [item for _, _, item in sorted(best.values(), key=lambda entry: (-entry[0], entry[1]))]
     
     def _merge_business_info(self, business1: Dict[str, Any], business2: Dict[str, Any]) -> Dict[str, Any]:
         """Merge business information with data completeness prioritization."""
@@ -388,50 +558,20 @@ class LeadDeduplicator:
         # Use more recent timestamp
         ts1 = meta1.get('extraction_timestamp', '')
         ts2 = meta2.get('extraction_timestamp', '')
-        merged['extraction_timestamp'] = max(ts1, ts2) if ts1 and ts2 else (ts1 or ts2)
+        if ts1 and ts2:
+            epoch1 = _parse_extraction_epoch(ts1)
+            epoch2 = _parse_extraction_epoch(ts2)
+            if epoch1 is not None and epoch2 is not None:
+                merged['extraction_timestamp'] = ts1 if epoch1 >= epoch2 else ts2
+            else:
+                merged['extraction_timestamp'] = max(ts1, ts2)
+        else:
+            merged['extraction_timestamp'] = ts1 or ts2
         
-        # Combine URLs
-        urls = []
-        if meta1.get('url'):
-            urls.append(meta1['url'])
-        if meta2.get('url') and meta2['url'] not in urls:
-            urls.append(meta2['url'])
-        merged['url'] = urls[0] if len(urls) == 1 else urls
+        # Combine URLs in first-seen order; either side may already hold a merged list
+        merged['url'] = list(dict.fromkeys(chain(_url_list(meta1.get('url')), _url_list(meta2.get('url')))))
         
         return merged
-    
-    def _find_lead_index_by_key(self, leads: List[Dict[str, Any]], key: str) -> Optional[int]:
-        """Find lead index that matches the given composite key."""
-        for i, lead in enumerate(leads):
-            if self._leads_match_key(lead, key):
-                return i
-        return None
-    
-    def _leads_match_key(self, lead: Dict[str, Any], key: str) -> bool:
-        """Check if lead matches the composite key."""
-        # Reconstruct key from lead
-        key_parts = []
-        
-        emails = lead.get('contact_information', {}).get('emails', [])
-        if emails:
-            primary_email = emails[0].get('value', '').lower().strip()
-            if primary_email:
-                key_parts.append(f"email:{primary_email}")
-        
-        phones = lead.get('contact_information', {}).get('phones', [])
-        if phones:
-            primary_phone = phones[0].get('clean_value', '').strip()
-            if primary_phone:
-                key_parts.append(f"phone:{primary_phone}")
-        
-        websites = lead.get('contact_information', {}).get('websites', [])
-        if websites:
-            primary_website = websites[0].get('domain', '').lower().strip()
-            if primary_website:
-                key_parts.append(f"website:{primary_website}")
-        
-        lead_key = "|".join(sorted(key_parts))
-        return lead_key == key
 
 
 def process_leads_with_quality_engine(leads: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -447,21 +587,23 @@ def process_leads_with_quality_engine(leads: List[Dict[str, Any]]) -> Dict[str,
     unique_leads = deduplicator.deduplicate_leads(leads)
     
     # Step 2: Validation and Quality Scoring
-    processed_leads = []
+    # Leads are annotated in place; only the final ranked list is built
+    total_scores = []
     for lead in unique_leads:
         validation_results = validator.validate_lead(lead)
         quality_score = scorer.calculate_quality_score(lead, validation_results)
+        total_scores.append(quality_score['total_score'])
         
         # Add quality metadata to lead
         lead['data_quality'] = {
             'validation_results': validation_results,
             'quality_score': quality_score
         }
-        
-        processed_leads.append(lead)
     
-    # Sort by quality score
-    processed_leads.sort(key=lambda x: x['data_quality']['quality_score']['total_score'], reverse=True)
+    # Sort by quality score, using the flat score list instead of walking each lead's nested dicts
+    order = sorted(range(len(total_scores)), key=total_scores.__getitem__, reverse=True)
+    processed_leads = [unique_leads[i] for i in order]
+    total_scores.sort(reverse=True)
     
     return {
         'processed_leads': processed_leads,
@@ -470,8 +612,7 @@ def process_leads_with_quality_engine(leads: List[Dict[str, Any]]) -> Dict[str,
             'deduplicated_count': len(unique_leads),
             'final_count': len(processed_leads),
             'duplicates_removed': len(leads) - len(unique_leads),
-            'average_quality_score': sum(lead['data_quality']['quality_score']['total_score'] 
-                                       for lead in processed_leads) / len(processed_leads) if processed_leads else 0
+            'average_quality_score': sum(total_scores) / len(total_scores) if total_scores else 0
         }
     }
 
@@ -512,22 +653,10 @@ class DataValidator:
             validation_results["validation_warnings"].extend(contact_result["warnings"])
 
         # --- Require at least one usable contact channel ---
-        has_phone = bool(contact_info.get("phones"))
-        has_email = bool(contact_info.get("emails"))
-        has_website = bool(contact_info.get("websites"))
-
-        if not (has_phone or has_email or has_website):
-            validation_results["overall_valid"] = False
-            validation_results["validation_errors"].append("No contact method available")
-
-        # --- Decide final validity ---
         # If only business name missing, treat as still valid but penalized elsewhere
-        if (
-            not has_phone
-            and not has_email
-            and not has_website
-        ):
+        if not (contact_info.get("phones") or contact_info.get("emails") or contact_info.get("websites")):
             validation_results["overall_valid"] = False
+            validation_results["validation_errors"].append("No contact method available")
 
         return validation_results
     
@@ -566,8 +695,7 @@ class DataValidator:
             return False
         
         # Basic syntax validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email))
+        return _EMAIL_RE.fullmatch(email) is not None
     
     def _validate_phone(self, phone: str) -> bool:
         """Phone number format validation."""
@@ -575,10 +703,10 @@ class DataValidator:
             return False
         
         # Extract digits
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(_KEEP_DIGITS)
         
         # Check length and patterns
-        return 7 <= len(digits) <= 15 and len(set(digits)) > 1
+        return _is_plausible_phone_digits(digits)
     
     def _validate_business_info(self, business_info: Dict[str, Any]) -> Dict[str, Any]:
         """Business validation."""
@@ -607,23 +735,24 @@ class DataValidator:
 class QualityScorer:
     """Quality scoring system as specified in Phase 6.3."""
     
+    WEIGHTS = {
+        'completeness': 0.40,
+        'accuracy': 0.30,
+        'freshness': 0.15,
+        'reliability': 0.15
+    }
+    
     def calculate_quality_score(self, lead: Dict[str, Any], validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate comprehensive quality score."""
         
         # Component scores (0-1 scale)
-        completeness_score = self._calculate_completeness_score(lead)
+        completeness_score = self._calculate_completeness_score(lead, validation_results)
         accuracy_score = self._calculate_accuracy_score(validation_results)
         freshness_score = self._calculate_freshness_score(lead)
         reliability_score = self._calculate_reliability_score(lead)
         
         # Weighted total (0-100 scale)
-        weights = {
-            'completeness': 0.40,
-            'accuracy': 0.30,
-            'freshness': 0.15,
-            'reliability': 0.15
-        }
-        
+        weights = self.WEIGHTS
         total_score = (
             completeness_score * weights['completeness'] +
             accuracy_score * weights['accuracy'] +
@@ -639,39 +768,38 @@ class QualityScorer:
                 'freshness': round(freshness_score * 100, 1),
                 'reliability': round(reliability_score * 100, 1)
             },
-            'weights': weights,
+            'weights': dict(weights),
             'quality_grade': self._get_quality_grade(total_score)
         }
     
-    def _calculate_completeness_score(self, lead: Dict[str, Any]) -> float:
+    def _calculate_completeness_score(self, lead: Dict[str, Any], validation_results: Dict[str, Any]) -> float:
         """Completeness score - only counts valid, useful fields."""
-        validator = DataValidator()
-        validation = validator.validate_lead(lead)
-
+        contact_info = _contact_info(lead)
+        business_info = lead.get('business_information') or _EMPTY_DICT
         score = 0
         checks = 0
 
         # Phone (must be valid)
         checks += 1
-        if validation['contact_validation']['valid'] and lead.get('contact_information', {}).get('phones'):
+        if validation_results['contact_validation']['valid'] and contact_info.get('phones'):
             score += 1
 
         # Industry (not empty or 'general')
         checks += 1
-        industry = lead.get('business_information', {}).get('industry', '').strip().lower()
+        industry = business_info.get('industry', '').strip().lower()
         if industry and industry not in ['general', 'n/a', 'none', 'unknown']:
             score += 1
 
         # Lead score (non-zero)
         checks += 1
-        if lead.get('lead_score', {}).get('total_score', 0) > 0:
+        if (lead.get('lead_score') or _EMPTY_DICT).get('total_score', 0) > 0:
             score += 1
 
         # Optional: company name or email add bonus completeness
-        if lead.get('business_information', {}).get('company_name', '').strip():
+        if business_info.get('company_name', '').strip():
             score += 0.5
             checks += 0.5
-        if lead.get('contact_information', {}).get('emails'):
+        if contact_info.get('emails'):
             score += 0.5
             checks += 0.5
 
@@ -699,44 +827,28 @@ class QualityScorer:
 
     def _calculate_freshness_score(self, lead: Dict[str, Any]) -> float:
         """Freshness score - data extraction timestamp."""
-        timestamp_str = lead.get('extraction_metadata', {}).get('extraction_timestamp', '')
+        timestamp_str = (lead.get('extraction_metadata') or _EMPTY_DICT).get('extraction_timestamp', '')
     
         if not timestamp_str:
             return 0.5
         
-        try:
-            # Handle different timestamp formats more robustly
-            if timestamp_str.endswith('Z'):
-                timestamp_str = timestamp_str.replace('Z', '+00:00')
-            elif not timestamp_str.endswith(('+00:00', '-00:00')) and 'T' in timestamp_str:
-                # If no timezone info, assume UTC
-                timestamp_str += '+00:00'
-            
-            extraction_time = datetime.fromisoformat(timestamp_str)
-            
-            # Always use UTC for consistent comparison
-            now = datetime.now(timezone.utc)
-            
-            # Ensure extraction_time is timezone-aware (convert to UTC if needed)
-            if extraction_time.tzinfo is None:
-                extraction_time = extraction_time.replace(tzinfo=timezone.utc)
-            else:
-                extraction_time = extraction_time.astimezone(timezone.utc)
-            
-            age_days = (now - extraction_time).days
-            score = math.exp(-age_days / 365.0)
-            return min(1.0, max(0.0, score))
-            
-        except Exception:
+        epoch = _parse_extraction_epoch(timestamp_str)
+        if epoch is None:
             return 0.5
+        
+        # Whole days elapsed, as timedelta.days would give
+        age_days = (time.time() - epoch) // 86400
+        score = math.exp(-age_days / 365.0)
+        return min(1.0, max(0.0, score))
     
     def _calculate_reliability_score(self, lead: Dict[str, Any]) -> float:
         """Reliability score - source credibility."""
-        data_confidence = lead.get('extraction_metadata', {}).get('data_confidence', 0.0)
+        data_confidence = (lead.get('extraction_metadata') or _EMPTY_DICT).get('data_confidence', 0.0)
         
+        contact_info = _contact_info(lead)
         contact_confidences = []
-        for field in ['emails', 'phones', 'websites']:
-            for item in lead.get('contact_information', {}).get(field, []):
+        for field in ('emails', 'phones', 'websites'):
+            for item in contact_info.get(field) or _EMPTY_LIST:
                 if 'confidence' in item:
                     contact_confidences.append(item['confidence'])
         
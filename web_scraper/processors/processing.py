@@ -2,97 +2,183 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup, Comment
+from lxml import etree
 from loguru import logger
 
 EMAIL_REGEX = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
-PHONE_REGEX = re.compile(r"(?:(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?|\d{2,4}[\s.-])?\d{3}[\s.-]?\d{3,4}(?:[\s.-]?\d{3,4})?)")
-
+_JSONLD_TYPE_RE = re.compile(r"ld\+json", re.I)
+# Alternatives, tried in order:
+# - international: "+" and country code, an optional "(0)"-style trunk or area code, then groups
+#   of any length split by separators (+61 2 9876 5432, +91 98765 43210, +7 495 123-45-67)
+# - area code then 3-2-2 subscriber groups (495 123-45-67)
+# - area code, optionally parenthesised, then two 3-4 digit groups (020 7946 0958, (02) 9876 5432)
+# - 5-5 grouping (98765 43210)
+# - a bare 7-digit local number (555-1234)
+# The digit boundaries stop matches from starting or ending inside longer digit runs such as IDs
+PHONE_REGEX = re.compile(
+	r"(?<!\d)(?:"
+	r"\+\d{1,3}(?:[\s.-]?\(\d{1,4}\))?[\s.-]?\d{1,12}(?:[\s.-]\d{1,12}){0,4}"
+	r"|(?:\(\d{3,4}\)|\d{3,4})[\s.-]?\d{3}[\s.-]\d{2}[\s.-]\d{2}"
+	r"|(?:\(\d{1,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}"
+	r"|\d{5}[\s.-]?\d{5}"
+	r"|\d{3}[\s.-]?\d{4}"
+	r")(?!\d)"
+)
+# Shortest local number and longest E.164 number
+_PHONE_MIN_DIGITS = 7
+_PHONE_MAX_DIGITS = 15
+# Phone matches only span digits, whitespace and ".()+-" and start at a digit, "(" or "+", so
+# PHONE_REGEX only needs to run over these runs instead of backtracking through the whole page
+_PHONE_CANDIDATE_RE = re.compile(r"[\d(+][\d\s().+-]{6,}")
+
+
+def _squash_blank_lines(text: str) -> str:
+	"""Collapse runs of three or more newlines to two."""
+	# Stripped, newline-joined text rarely has any, so the substring check usually ends it
+	while "\n\n\n" in text:
+		text = text.replace("\n\n\n", "\n\n")
+	return text
+
+
+SECTION_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6", "p", "li", 'td', 'th', 'dd', 'dt', "a", "span", "footer"])
+
+
+# BeautifulSoup files strings inside these tags under their own string types, and get_text()
+# on any other tag skips them; mirror that so the lxml path yields the same text
+_STRING_CONTAINER_TAGS = frozenset(["rt", "rp", "template"])
+_DROPPED_TAGS = frozenset(["script", "style", "noscript"])
+# Whitespace-only text is dropped by every consumer and ids are never looked up, so don't keep either
+_HTML_PARSER = etree.HTMLParser(encoding="utf-8", remove_blank_text=True, collect_ids=False)
+_JSONLD_SCRIPTS = etree.XPath(
+	"//script[contains(translate(@type, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'ld+json')]"
+)
+
+
+def _parse_tree(html: str) -> Optional[etree._Element]:
+	"""Parse html with lxml directly, skipping BeautifulSoup's per-node Python objects."""
+	if not html:
+		return None
+	return etree.fromstring(html.encode("utf-8", "replace"), _HTML_PARSER)
 
-def clean_html(html: str) -> Tuple[BeautifulSoup, str]:
-	"""Remove scripts/styles/comments and normalize whitespace, return soup and text."""
-	soup = BeautifulSoup(html, "lxml")
-	for element in soup(["script", "style", "noscript"]):
-		element.decompose()
-	# Remove HTML comments (avoid deprecated 'text' kwarg)
-	for comment in soup.find_all(string=lambda s: isinstance(s, Comment)):
-		comment.extract()
-	text = soup.get_text(separator="\n", strip=True)
-	# Normalize excessive blank lines
-	text = re.sub(r"\n{3,}", "\n\n", text)
-	return soup, text
 
+def _extract_from_tree(root: etree._Element, with_jsonld: bool = True) -> Tuple[List[Dict], str, List[Dict[str, str]], List[Dict[str, str]], List[Dict[str, str]]]:
+	"""Return JSON-LD data, cleaned text, links, images and sections from one parsed tree.
 
-def parse_jsonld_scripts(soup: BeautifulSoup) -> List[Dict]:
+	with_jsonld=False skips the JSON-LD script lookup when the caller knows there are none.
+	"""
 	structured: List[Dict] = []
-	for tag in soup.find_all("script", type=lambda t: t and "ld+json" in t.lower()):
+	for tag in _JSONLD_SCRIPTS(root) if with_jsonld else ():
+		# Empty scripts carry no data, so skip them without entering json.loads
+		if not tag.text:
+			continue
 		try:
-			data = json.loads(tag.string or "{}")
+			data = json.loads(tag.text)
 			if isinstance(data, list):
 				structured.extend([d for d in data if isinstance(d, dict)])
 			elif isinstance(data, dict):
 				structured.append(data)
 		except Exception:
 			continue
-	return structured
 
-
-def extract_links_and_images(soup: BeautifulSoup) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+	# Stripped text nodes, keyed by the string-container context they sit in. An element's text
+	# is the run of its context's list appended between its start and end events.
+	strings: Dict[Optional[str], List[str]] = {None: [], "rt": [], "rp": [], "template": []}
 	links: List[Dict[str, str]] = []
-	for a in soup.find_all("a", href=True):
-		text = (a.get_text(strip=True) or "")[:200]
-		links.append({"href": a["href"], "text": text})
 	images: List[Dict[str, str]] = []
-	for img in soup.find_all("img"):
-		images.append({
-			"src": img.get("src", ""),
-			"alt": img.get("alt", "")
-		})
-	return links, images
-
-
-def section_content(soup: BeautifulSoup) -> List[Dict[str, str]]:
-	"""Segment content into sections using specific tags and return as List[Dict]."""
-	sections = []
-	section_tags = ["h1", "h2", "h3", "h4", "h5", "h6", "p", "li", 'td', 'th', 'dd', 'dt', "a", "span", "footer"]
-	
-	for node in soup.find_all(section_tags):
-		text = node.get_text(strip=True)
-		if text and len(text) > 7:  # Filter out very short content
-			section_data = {
-				"tag": node.name,
-				"text": text,
-				"class": " ".join(node.get("class", [])),
-				"id": node.get("id", ""),
-				"parent_tag": node.parent.name if node.parent else ""
-			}
-			sections.append(section_data)
-	
-	return sections
+	sections: List[Dict[str, str]] = []
+	# (context, wanted context, start offset, link entry, section entry) per open element
+	stack: List[Tuple] = [(None, None, 0, None, None)]
+	walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+	for event, node in walker:
+		if event == "start":
+			name = node.tag
+			if name in _DROPPED_TAGS:
+				walker.skip_subtree()
+				stack.append((stack[-1][0], None, 0, None, None))  # popped by the matching end event
+				continue
+			if name in _STRING_CONTAINER_TAGS:
+				context = wanted = name
+			else:
+				context, wanted = stack[-1][0], None
+			link = section = None
+			if name == "img":
+				images.append({
+					"src": node.get("src", ""),
+					"alt": node.get("alt", "")
+				})
+			else:
+				if name == "a" and node.get("href") is not None:
+					link = {"href": node.get("href"), "text": ""}
+					links.append(link)
+				if name in SECTION_TAGS:
+					parent = node.getparent()
+					section = {
+						"tag": name,
+						"text": "",
+						"class": " ".join((node.get("class") or "").split()),
+						"id": node.get("id", ""),
+						"parent_tag": parent.tag if parent is not None else ""
+					}
+					sections.append(section)
+			stack.append((context, wanted, len(strings[wanted]), link, section))
+			if node.text:
+				text = node.text.strip()
+				if text:
+					strings[context].append(text)
+			continue
+
+		if event == "end":
+			_, wanted, start, link, section = stack.pop()
+			if link is not None or section is not None:
+				text = "".join(strings[wanted][start:])
+				if link is not None:
+					link["text"] = text[:200]
+				if section is not None:
+					section["text"] = text
+			if node is root:
+				continue
+		# Text after an element, comment or PI belongs to the enclosing element
+		if node.tail:
+			text = node.tail.strip()
+			if text:
+				strings[stack[-1][0]].append(text)
+
+	text = _squash_blank_lines("\n".join(strings[None]))
+
+	sections = [section for section in sections if len(section["text"]) > 7]  # Filter out very short content
+
+	return structured, text, links, images, sections
 
 
 def extract_contact_patterns(text: str, links: List[Dict[str, str]]) -> Tuple[List[str], List[str]]:
-	emails = sorted(set(EMAIL_REGEX.findall(text)))
-	phones = sorted(set([p.strip() for p in PHONE_REGEX.findall(text) if len(p.strip()) >= 7]))
+	# Every match contains "@", so pages without one skip the scan entirely
+	emails = set(EMAIL_REGEX.findall(text)) if "@" in text else set()
+	phones = set()
+	for candidate in _PHONE_CANDIDATE_RE.findall(text):
+		for p in PHONE_REGEX.findall(candidate):
+			p = p.strip()
+			if _PHONE_MIN_DIGITS <= sum(c.isdigit() for c in p) <= _PHONE_MAX_DIGITS:
+				phones.add(p)
 	# Also check mailto links
 	for link in links:
 		href = link.get("href", "")
 		if href.startswith("mailto:"):
-			emails.append(href[len("mailto:"):])
-	emails = sorted(set(emails))
-	return emails, phones
+			emails.add(href[len("mailto:"):])
+	return sorted(emails), sorted(phones)
 
 
 def process_content(html: str) -> Dict:
 	try:
-		raw_soup = BeautifulSoup(html, "lxml")
-		extract_jsonld = parse_jsonld_scripts(raw_soup)
-
-		soup, cleaned_text = clean_html(html)
-		links, images = extract_links_and_images(soup)
-		sections = section_content(soup)
+		root = _parse_tree(html)
+		if root is None:
+			extract_jsonld, cleaned_text, links, images, sections = [], "", [], [], []
+		else:
+			# Most pages carry no JSON-LD; a regex scan is far cheaper than the script lookup and,
+			# like the XPath, ignores case
+			has_jsonld = _JSONLD_TYPE_RE.search(html) is not None
+			extract_jsonld, cleaned_text, links, images, sections = _extract_from_tree(root, with_jsonld=has_jsonld)
 		emails, phones = extract_contact_patterns(cleaned_text, links)
 		logger.debug(f"Content processed successfully inside process_content")
 		
@@ -0,0 +1,47 @@
+import pytest
+
+from web_scraper.processors.processing import extract_contact_patterns
+
+# Numbers that must be found whole, in the format they were written
+PHONE_GOLDEN = [
+	"+1 (555) 123-4567",
+	"+1-555-123-4567",
+	"+44 20 7946 0958",
+	"+44 (0)20 7946 0958",
+	"+442079460958",
+	"+49 30 12345678",
+	"+33 1 23 45 67 89",
+	"+61 2 9876 5432",
+	"+65 6123 4567",
+	"+7 495 123-45-67",
+	"+91 98765 43210",
+	"(555) 123-4567",
+	"555.123.4567",
+	"555-1234",
+	"020 7946 0958",
+	"(02) 9876 5432",
+	"495 123-45-67",
+	"98765 43210",
+]
+
+# Digit runs that are not phone numbers
+NOT_PHONES = [
+	"Order 1234567890123456",
+	"ID 12345678901234567890",
+	"1999-2005",
+	"Price 3.14",
+	"v1.2.3",
+	"+1 555 1",
+]
+
+
+@pytest.mark.parametrize("number", PHONE_GOLDEN)
+def test_phone_found_whole(number):
+	_, phones = extract_contact_patterns(f"Call us on {number} today.", [])
+	assert phones == [number]
+
+
+@pytest.mark.parametrize("text", NOT_PHONES)
+def test_no_phone(text):
+	_, phones = extract_contact_patterns(text, [])
+	assert phones == []
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
 import time
-from typing import Optional
+import weakref
+from typing import Optional, Tuple
 
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from web_scraper.data_models.models import PageContent
-from web_scraper.utils.anti_detection import AntiDetectionManager, execute_human_behavior, create_stealth_browser_context
+from web_scraper.processors.processing import process_content
+from web_scraper.utils.anti_detection import (
+	AntiDetectionManager,
+	execute_human_behavior,
+	create_stealth_context,
+	launch_stealth_browser,
+)
 
 
 async def _ensure_playwright():
@@ -21,21 +29,40 @@ async def _ensure_playwright():
 		) from e
 
 
-async def _create_context(pw):
-	try:
-		# Optional anti-detection integration
-		adm = AntiDetectionManager(
-			enable_fingerprint_evasion=True,
-			enable_behavioral_mimicking=True,
-			enable_network_obfuscation=True,
-		)
-		browser, context = await create_stealth_browser_context(pw, adm, is_mobile=False)
-		return browser, context, adm
-	except Exception as e:
-		logger.warning(f"Anti-detection context failed, falling back: {e}")
-		browser = await pw.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])  # type: ignore
-		context = await browser.new_context()
-		return browser, context, None
+# Tries, in order: buttons named by a label, any element whose text contains a label, then CSS
+# selectors; clicks the first visible match and returns what matched (null when nothing did)
+_DISMISS_POPUPS_JS = """
+(cfg) => {
+	const visible = (el) => {
+		const rect = el.getBoundingClientRect();
+		return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+	};
+	const norm = (s) => (s || "").replace(/\\s+/g, " ").trim().toLowerCase();
+	const labels = cfg.labels.map(norm);
+	const buttons = [...document.querySelectorAll("button, [role='button'], input[type='button'], input[type='submit']")];
+	for (const label of labels) {
+		const btn = buttons.find((el) => norm(el.getAttribute("aria-label") || el.innerText || el.value).includes(label) && visible(el));
+		if (btn) { btn.click(); return label; }
+	}
+	const texts = [];
+	const walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+	for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+		const text = norm(node.nodeValue);
+		if (text) texts.push([text, node.parentElement]);
+	}
+	for (const label of labels) {
+		const hit = texts.find(([text, el]) => el && text.includes(label) && visible(el));
+		if (hit) { hit[1].click(); return label; }
+	}
+	for (const sel of cfg.selectors) {
+		let matches;
+		try { matches = document.querySelectorAll(sel); } catch (e) { continue; }
+		const el = [...matches].find(visible);
+		if (el) { el.click(); return sel; }
+	}
+	return null;
+}
+"""
 
 
 async def _dismiss_popups(page, adm: Optional[AntiDetectionManager] = None):
@@ -75,45 +102,13 @@ async def _dismiss_popups(page, adm: Optional[AntiDetectionManager] = None):
 		".newsletter, .cookie, .cookies, .gdpr, .consent",
 	]
 
-	async def _click_if_visible(locator):
-		try:
-			if await locator.is_visible():
-				# slight human-like pause
-				if adm:
-					await asyncio.sleep(0.2)
-				await locator.click(timeout=1500)
-				return True
-		except Exception:
-			return False
-		return False
-
-	# Try role-based buttons with text
+	# One in-page pass instead of an is_visible/click round-trip per label and selector
 	try:
-		for label in text_buttons + cookie_specific:
-			btn = page.get_by_role("button", name=label)
-			if await _click_if_visible(btn):
-				return
+		if await page.evaluate(_DISMISS_POPUPS_JS, {"labels": text_buttons + cookie_specific, "selectors": selectors}):
+			return
 	except Exception:
 		pass
 
-	# Try text locators for links/divs that act as buttons
-	try:
-		for label in text_buttons + cookie_specific:
-			el = page.get_by_text(label, exact=False)
-			if await _click_if_visible(el):
-				return
-	except Exception:
-		pass
-
-	# Try CSS selectors
-	for sel in selectors:
-		try:
-			loc = page.locator(sel)
-			if await _click_if_visible(loc):
-				return
-		except Exception:
-			continue
-
 	# Last resort: press Escape to dismiss dialogs
 	try:
 		await page.keyboard.press("Escape")
@@ -131,107 +126,260 @@ async def _dismiss_popups(page, adm: Optional[AntiDetectionManager] = None):
 		pass
 
 
+async def _apply_network_obfuscation(adm: Optional[AntiDetectionManager]) -> bool:
+	"""Delay before navigating and increment counters. Returns True if the fingerprint should rotate."""
+	if adm is None:
+		return False
+	try:
+		delay = await adm.calculate_request_delay()
+		if delay > 0:
+			await asyncio.sleep(delay)
+		adm.request_count += 1
+		adm.last_request_time = time.time()
+		return await adm.should_rotate_fingerprint()
+	except Exception:
+		return False
+
+
+async def _load_page(page, adm: Optional[AntiDetectionManager], url: str, wait_for_selector: Optional[str], timeout_ms: int) -> Tuple[str, int]:
+	"""Navigate an open page to url and return (html, status) after waits, popups and scrolling."""
+	try:
+		resp = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+	except Exception as e:
+		# Check if it's a network-related error
+		error_str = str(e).lower()
+		if any(network_error in error_str for network_error in [
+			'net::err_http2_protocol_error', 'net::err_name_not_resolved', 
+			'timeout', 'connection', 'network', 'dns', 'refused'
+		]):
+			logger.warning(f"Network error accessing {url}: {e}")
+			raise RuntimeError(f"Network error: {e}") from e
+		else:
+			raise
+	# Progressive waits per plan
+	try:
+		await page.wait_for_load_state("networkidle", timeout=timeout_ms // 2)
+	except Exception:
+		pass
+	if wait_for_selector:
+		try:
+			await page.wait_for_selector(wait_for_selector, timeout=timeout_ms // 2)
+		except Exception:
+			pass
+	# Try dismissing popups early
+	try:
+		await _dismiss_popups(page, adm)
+	except Exception:
+		pass
+	# Basic scroll to trigger lazy content
+	try:
+		h = await page.evaluate("() => document.body.scrollHeight")
+		manager_for_actions = adm if adm is not None else AntiDetectionManager()
+		await execute_human_behavior(page, manager_for_actions, behavior_type='scroll', position=int(h))
+		# Light mouse move near the center to simulate activity
+		viewport = await page.viewport_size()
+		if viewport:
+			await execute_human_behavior(page, manager_for_actions, behavior_type='mousemove', position=(int(viewport['width'] * 0.6), int(viewport['height'] * 0.6)))
+	except Exception:
+		pass
+	# Try dismissing popups again after interactions
+	try:
+		await _dismiss_popups(page, adm)
+	except Exception:
+		pass
+
+	html = await page.content()
+	status = (resp.status if resp else 200)
+	return html, status
+
+
+def _build_page_content(url: str, html: str, status: int, elapsed: float) -> PageContent:
+	return PageContent(
+		url=url,
+		status_code=status,
+		elapsed_seconds=elapsed,
+		encoding="utf-8",
+		content_type="text/html",
+		html=html,
+		metadata={},
+	)
+
+
+class _SharedBrowser:
+	"""Playwright driver and browser shared by dynamic fetches on one event loop."""
+
+	def __init__(self) -> None:
+		self.pw = None
+		self.browser = None
+		self.lock = asyncio.Lock()
+
+	async def close(self) -> None:
+		pw, browser = self.pw, self.browser
+		self.pw, self.browser = None, None
+		try:
+			if browser is not None:
+				await browser.close()
+			if pw is not None:
+				await pw.stop()
+		except Exception as e:
+			logger.warning(f"Failed to close shared Playwright browser: {e}")
+
+
+# One shared browser per event loop, since Playwright objects belong to the loop that created
+# them; entries go away with their loop. The dict itself is shared across threads.
+_PW_BY_LOOP: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedBrowser]" = weakref.WeakKeyDictionary()
+_PW_REGISTRY_LOCK = threading.Lock()
+
+
+async def _get_shared_browser():
+	"""Return the pooled browser for the running loop, launching it on first use."""
+	loop = asyncio.get_running_loop()
+	with _PW_REGISTRY_LOCK:
+		shared = _PW_BY_LOOP.get(loop)
+		if shared is None:
+			shared = _PW_BY_LOOP[loop] = _SharedBrowser()
+	async with shared.lock:
+		if shared.browser is not None and shared.browser.is_connected():
+			return shared.browser
+		# A disconnected browser is replaced; close what is left of it first
+		await shared.close()
+		async_playwright = await _ensure_playwright()
+		pw = await async_playwright().start()
+		try:
+			browser = await launch_stealth_browser(pw)
+		except Exception as e:
+			logger.warning(f"Stealth browser launch failed, falling back: {e}")
+			try:
+				browser = await pw.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])  # type: ignore
+			except Exception:
+				await pw.stop()
+				raise
+		shared.pw, shared.browser = pw, browser
+		return browser
+
+
+async def _create_pooled_context(browser):
+	"""Open a fresh (fingerprinted when possible) context on the shared browser."""
+	try:
+		adm = AntiDetectionManager(
+			enable_fingerprint_evasion=True,
+			enable_behavioral_mimicking=True,
+			enable_network_obfuscation=True,
+		)
+		context = await create_stealth_context(browser, adm, is_mobile=False)
+		return context, adm
+	except Exception as e:
+		logger.warning(f"Anti-detection context failed, falling back: {e}")
+		return await browser.new_context(), None
+
+
+async def close_playwright_async() -> None:
+	"""Close the browser shared by dynamic fetches on the running loop."""
+	with _PW_REGISTRY_LOCK:
+		shared = _PW_BY_LOOP.pop(asyncio.get_running_loop(), None)
+	if shared is not None:
+		async with shared.lock:
+			await shared.close()
+
+
+def close_playwright() -> None:
+	"""Close every shared browser whose loop can still run."""
+	with _PW_REGISTRY_LOCK:
+		loops = list(_PW_BY_LOOP.keys())
+	for loop in loops:
+		if loop.is_closed() or loop.is_running():
+			continue
+		loop.run_until_complete(close_playwright_async())
+
+
+atexit.register(close_playwright)
+
+
 async def fetch_dynamic_async(url: str, wait_for_selector: Optional[str] = None, timeout_ms: int = 30000) -> PageContent:
-	async_playwright = await _ensure_playwright()
 	start = time.time()
-	async with async_playwright() as pw:
-		browser, context, adm = await _create_context(pw)
-		page = await context.new_page()
+	browser = await _get_shared_browser()
+	context, adm = await _create_pooled_context(browser)
+	try:
 		logger.info(f"Fetching URL (dynamic): {url}")
-		# Network obfuscation: delay before navigating and increment counters
-		if adm is not None:
+		# Optional: rotate fingerprint between navigations (a new context is cheap on the shared browser)
+		if await _apply_network_obfuscation(adm):
 			try:
-				delay = await adm.calculate_request_delay()
-				if delay > 0:
-					await asyncio.sleep(delay)
-				adm.request_count += 1
-				adm.last_request_time = time.time()
-				# Optional: rotate fingerprint between navigations (recreate context if needed)
-				if await adm.should_rotate_fingerprint():
-					try:
-						await context.close()
-						await browser.close()
-						browser, context, adm = await _create_context(pw)
-						page = await context.new_page()
-					except Exception:
-						pass
+				await context.close()
+				context, adm = await _create_pooled_context(browser)
 			except Exception:
 				pass
+		page = await context.new_page()
+		html, status = await _load_page(page, adm, url, wait_for_selector, timeout_ms)
+		elapsed = time.time() - start
+	finally:
 		try:
-			resp = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
-		except Exception as e:
-			# Check if it's a network-related error
-			error_str = str(e).lower()
-			if any(network_error in error_str for network_error in [
-				'net::err_http2_protocol_error', 'net::err_name_not_resolved', 
-				'timeout', 'connection', 'network', 'dns', 'refused'
-			]):
-				logger.warning(f"Network error accessing {url}: {e}")
-				raise RuntimeError(f"Network error: {e}") from e
-			else:
-				raise
-		# Progressive waits per plan
-		try:
-			await page.wait_for_load_state("networkidle", timeout=timeout_ms // 2)
+			await context.close()
 		except Exception:
 			pass
-		if wait_for_selector:
+
+	return _build_page_content(url, html, status, elapsed)
+
+
+class DynamicBrowserSession:
+	"""Long-lived Playwright context reused across dynamic fetches.
+
+	Each session owns its own event loop, and with it that loop's shared browser, so it
+	must only be used from one thread at a time. Call close() when done to shut down the browser.
+	"""
+
+	def __init__(self) -> None:
+		self._loop = asyncio.new_event_loop()
+		self._context = None
+		self._adm: Optional[AntiDetectionManager] = None
+
+	async def _close_context(self) -> None:
+		context, self._context, self._adm = self._context, None, None
+		if context is not None:
 			try:
-				await page.wait_for_selector(wait_for_selector, timeout=timeout_ms // 2)
+				await context.close()
 			except Exception:
 				pass
-		# Try dismissing popups early
-		try:
-			await _dismiss_popups(page, adm)
-		except Exception:
-			pass
-		# Basic scroll to trigger lazy content
-		try:
-			h = await page.evaluate("() => document.body.scrollHeight")
-			manager_for_actions = adm if adm is not None else AntiDetectionManager()
-			await execute_human_behavior(page, manager_for_actions, behavior_type='scroll', position=int(h))
-			# Light mouse move near the center to simulate activity
-			viewport = await page.viewport_size()
-			if viewport:
-				await execute_human_behavior(page, manager_for_actions, behavior_type='mousemove', position=(int(viewport['width'] * 0.6), int(viewport['height'] * 0.6)))
-		except Exception:
-			pass
-		# Try dismissing popups again after interactions
-		try:
-			await _dismiss_popups(page, adm)
-		except Exception:
-			pass
 
-		html = await page.content()
-		status = (resp.status if resp else 200)
-		elapsed = time.time() - start
+	async def fetch_async(self, url: str, wait_for_selector: Optional[str] = None, timeout_ms: int = 30000) -> PageContent:
+		start = time.time()
+		if self._context is None:
+			browser = await _get_shared_browser()
+			self._context, self._adm = await _create_pooled_context(browser)
+
+		logger.info(f"Fetching URL (dynamic, reused context): {url}")
+		if await _apply_network_obfuscation(self._adm):
+			# Rotate onto a fresh context. A creation error propagates and leaves _context
+			# None, so the next fetch retries the creation instead of using a closed context.
+			await self._close_context()
+			browser = await _get_shared_browser()
+			self._context, self._adm = await _create_pooled_context(browser)
+
+		page = await self._context.new_page()
+		try:
+			html, status = await _load_page(page, self._adm, url, wait_for_selector, timeout_ms)
+		finally:
+			try:
+				await page.close()
+			except Exception:
+				pass
+		return _build_page_content(url, html, status, time.time() - start)
 
-		await context.close()
-		await browser.close()
-
-		# Normalize to text-only per Phase 3.1 pipeline basics
-		soup = BeautifulSoup(html, "lxml")
-		for tag in soup.find_all("script"):
-			if tag.get("type") not in ("application/ld+json", "application/json"):
-				tag.decompose()
-
-		# Still remove all <style> tags
-		for tag in soup.find_all("style"):
-			tag.decompose()
-		
-		text_only = soup.get_text(separator="\n", strip=True)
-
-		return PageContent(
-			url=url,
-			status_code=status,
-			elapsed_seconds=elapsed,
-			encoding="utf-8",
-			content_type="text/html",
-			html=html,
-			text=text_only,
-			metadata={},
+	def fetch(self, url: str, wait_for_selector: Optional[str] = None, timeout_ms: int = 30000) -> PageContent:
+		return self._loop.run_until_complete(
+			self.fetch_async(url, wait_for_selector=wait_for_selector, timeout_ms=timeout_ms)
 		)
 
+	def close(self) -> None:
+		if self._loop.is_closed():
+			return
+		try:
+			self._loop.run_until_complete(self._close_context())
+			self._loop.run_until_complete(close_playwright_async())
+		except Exception as e:
+			logger.warning(f"Failed to close dynamic browser session: {e}")
+		finally:
+			self._loop.close()
+
 
 def fetch_dynamic(url: str, wait_for_selector: Optional[str] = None, timeout_ms: int = 30000) -> PageContent:
 	try:
@@ -263,7 +411,7 @@ def smoke_test_scraper_dynamic(url: str = "https://www.instagram.com/p/DCI2BSPSz
 			"elapsed_seconds": page.elapsed_seconds,
 			"encoding": page.encoding,
 			"content_type": page.content_type,
-			"text_preview": page.text[:200],
+			"text_preview": process_content(page.html)["cleaned_text"][:200],
 		}
 	except Exception as e:
 		return {"ok": False, "url": url, "error": str(e)}
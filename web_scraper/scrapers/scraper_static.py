@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-import asyncio
+import codecs
+import re
 import time
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-import chardet
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from web_scraper.data_models.models import PageContent
 from web_scraper.utils.anti_detection import AntiDetectionManager
 
+try:
+	from cchardet import detect as _detect_encoding  # type: ignore
+except ImportError:
+	from charset_normalizer import detect as _detect_encoding
+
+# The encoding of an HTML page is settled well within its first 64 KiB
+_ENCODING_SNIFF_BYTES = 65536
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]*?charset\s*=\s*[\"']?([\w.:-]+)", re.I)
 
 _DEFAULT_HEADERS = {
 	"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
@@ -27,6 +35,33 @@ _DEFAULT_HEADERS = {
 }
 
 
+def _lookup_charset(match: Optional[re.Match]) -> Optional[str]:
+	if not match:
+		return None
+	label = match.group(1)
+	if isinstance(label, bytes):
+		label = label.decode("ascii", "ignore")
+	try:
+		return codecs.lookup(label).name
+	except LookupError:
+		return None
+
+
+def _resolve_encoding(content_type: str, raw: bytes) -> str:
+	"""Pick the body encoding: Content-Type charset, else <meta charset>, else detection on a prefix, else utf-8."""
+	prefix = raw[:_ENCODING_SNIFF_BYTES]
+	encoding = _lookup_charset(_CHARSET_RE.search(content_type)) or _lookup_charset(_META_CHARSET_RE.search(prefix))
+	if encoding:
+		return encoding
+	# Detect from a prefix; scanning the whole body costs more and rarely changes the answer
+	detected = (_detect_encoding(prefix).get("encoding") or "utf-8").lower()
+	# An all-ASCII prefix says nothing about the rest of the page; utf-8 decodes it the same
+	# and keeps any non-ASCII text further down
+	if detected in ("ascii", "us-ascii"):
+		return "utf-8"
+	return detected
+
+
 class StaticScraper:
 	def __init__(self, timeout: int = 30, headers: Optional[dict] = None, anti_detection: Optional[AntiDetectionManager] = None):
 		self.timeout = timeout
@@ -38,35 +73,50 @@ class StaticScraper:
 		)
 		# Reuse a single session for connection pooling and cookie jar reuse
 		self._session = requests.Session()
+		# Merged headers per (fingerprint rotation count, is_mobile), and the dict the session currently holds
+		self._cached_headers: Dict[Tuple[int, bool], dict] = {}
+		self._session_headers: Optional[dict] = None
 
-	def _build_headers(self) -> dict:
+	def _build_headers(self, is_mobile: bool = False) -> dict:
+		# Stealth headers draw a random UA, so keep one set per fingerprint until it rotates
+		key = (getattr(self.anti_detection, 'fingerprint_rotation_count', 0), is_mobile)
+		cached = self._cached_headers.get(key)
+		if cached is not None:
+			return cached
 		# Merge baseline headers with stealth headers; avoid brotli/zstd which requests may not decode
-		stealth = self.anti_detection._generate_stealth_headers(is_mobile=False)
+		stealth = self.anti_detection._generate_stealth_headers(is_mobile=is_mobile)
 		if "Accept-Encoding" in stealth:
 			stealth["Accept-Encoding"] = "gzip, deflate"
 		# Prefer stealth UA and sec-ch-* while retaining any explicit overrides passed by user
 		merged = dict(self.headers)
 		merged.update(stealth)
+		# Headers from earlier fingerprints are never asked for again
+		self._cached_headers = {k: v for k, v in self._cached_headers.items() if k[0] == key[0]}
+		self._cached_headers[key] = merged
 		return merged
 
+	def _use_headers(self, headers: dict) -> None:
+		# Only rewrite the session headers when a different header set is requested
+		if headers is self._session_headers:
+			return
+		self._session.headers.clear()
+		self._session.headers.update(headers)
+		self._session_headers = headers
+
+	def _rotate_fingerprint(self) -> None:
+		setattr(self.anti_detection, 'last_fingerprint_rotation', time.time())
+		setattr(self.anti_detection, 'fingerprint_rotation_count', getattr(self.anti_detection, 'fingerprint_rotation_count', 0) + 1)
+
 	def _apply_network_delay_and_rotate_if_needed(self) -> None:
 		# Apply human-like request spacing and rotate fingerprint periodically
-		try:
-			delay = asyncio.run(self.anti_detection.calculate_request_delay())
-		except RuntimeError:
-			# If we're inside an event loop (rare for static), fall back to no delay
-			delay = 0.0
+		# The delay and rotation checks never await, so call them directly instead of spinning up a loop
+		delay = self.anti_detection.calculate_request_delay_sync()
 		if delay > 0:
 			time.sleep(delay)
 		self.anti_detection.request_count += 1
 		self.anti_detection.last_request_time = time.time()
-		try:
-			should_rotate = asyncio.run(self.anti_detection.should_rotate_fingerprint())
-		except RuntimeError:
-			should_rotate = False
-		if should_rotate:
-			setattr(self.anti_detection, 'last_fingerprint_rotation', time.time())
-			setattr(self.anti_detection, 'fingerprint_rotation_count', getattr(self.anti_detection, 'fingerprint_rotation_count', 0) + 1)
+		if self.anti_detection.should_rotate_fingerprint_sync():
+			self._rotate_fingerprint()
 
 	@retry(
 		stop=stop_after_attempt(3),
@@ -77,9 +127,7 @@ class StaticScraper:
 		logger.info(f"Fetching URL (static): {url}")
 		start = time.time()
 		self._apply_network_delay_and_rotate_if_needed()
-		headers = self._build_headers()
-		self._session.headers.clear()
-		self._session.headers.update(headers)
+		self._use_headers(self._build_headers())
 		resp = self._session.get(url, timeout=self.timeout)
 		elapsed = time.time() - start
 		# If blocked by common anti-bot statuses, attempt dynamic fallback inline
@@ -89,9 +137,8 @@ class StaticScraper:
 			# Try a second attempt with rotated fingerprint headers (desktop)
 			try:
 				self._apply_network_delay_and_rotate_if_needed()
-				headers2 = self._build_headers()
-				self._session.headers.clear()
-				self._session.headers.update(headers2)
+				self._rotate_fingerprint()
+				self._use_headers(self._build_headers())
 				resp2 = self._session.get(url, timeout=self.timeout)
 				if resp2.status_code not in {403, 429, 503}:
 					resp = resp2
@@ -101,12 +148,7 @@ class StaticScraper:
 			if resp.status_code in {403, 429, 503}:
 				try:
 					self._apply_network_delay_and_rotate_if_needed()
-					stealth_mobile = self.anti_detection._generate_stealth_headers(is_mobile=True)
-					stealth_mobile["Accept-Encoding"] = "gzip, deflate"
-					mobile_headers = dict(self.headers)
-					mobile_headers.update(stealth_mobile)
-					self._session.headers.clear()
-					self._session.headers.update(mobile_headers)
+					self._use_headers(self._build_headers(is_mobile=True))
 					resp3 = self._session.get(url, timeout=self.timeout)
 					if resp3.status_code not in {403, 429, 503}:
 						resp = resp3
@@ -119,8 +161,7 @@ class StaticScraper:
 					parsed = urlparse(url)
 					base = f"{parsed.scheme}://{parsed.netloc}/"
 					self._apply_network_delay_and_rotate_if_needed()
-					self._session.headers.clear()
-					self._session.headers.update(self._build_headers())
+					self._use_headers(self._build_headers())
 					self._session.get(base, timeout=self.timeout)
 					self._apply_network_delay_and_rotate_if_needed()
 					resp4 = self._session.get(url, timeout=self.timeout)
@@ -132,37 +173,10 @@ class StaticScraper:
 		resp.raise_for_status()
 
 		raw = resp.content
-		encoding = None
-
-		# Respect provided encoding first
-		if resp.encoding:
-			encoding = resp.encoding
-			text = resp.text
-		else:
-			# Detect encoding
-			detected = chardet.detect(raw)
-			encoding = detected.get("encoding") or "utf-8"
-			text = raw.decode(encoding, errors="replace")
-
 		ct = (resp.headers.get("Content-Type") or "").lower()
-		html = text
-
-		# Normalize text (light cleaning for Phase 1)
-		soup = BeautifulSoup(html, "lxml")
-		# Attempt to remove common modal/overlay elements that hide content
-		for modal_selector in [
-			".cookie-banner", ".cookie-consent", ".cookies", ".gdpr",
-			".consent", "#onetrust-consent-sdk", ".ot-sdk-container",
-			".modal", ".modal-backdrop", ".newsletter", ".signup", ".overlay"
-		]:
-			for el in soup.select(modal_selector):
-				try:
-					el.decompose()
-				except Exception:
-					pass
-		for tag in soup(["script", "style"]):
-			tag.decompose()
-		text_only = soup.get_text(separator="\n", strip=True)
+		# Decode the body once ourselves; resp.text would guess ISO-8859-1 for any text/* without a charset
+		encoding = _resolve_encoding(ct, raw)
+		html = raw.decode(encoding, errors="replace")
 
 		return PageContent(
 			url=url,
@@ -171,7 +185,6 @@ class StaticScraper:
 			encoding=encoding,
 			content_type=ct,
 			html=html,
-			text=text_only,
 			metadata={
 				"server": resp.headers.get("Server", ""),
 				"content_length": str(len(raw)),
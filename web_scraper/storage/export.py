@@ -1,17 +1,268 @@
 from __future__ import annotations
 
-import json
 import csv
 import gzip
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Union
 import zipfile
 import io
+import multiprocessing
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 
+import numpy as np
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter
 from web_scraper.storage.storage import LeadModel, LeadStorage, LeadStatus
 
+try:
+    import ijson  # type: ignore
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
+
+try:
+    import mgzip  # type: ignore
+    _HAS_MGZIP = True
+except ImportError:
+    _HAS_MGZIP = False
+
+try:
+    import zstandard  # type: ignore
+    _HAS_ZSTD = True
+except ImportError:
+    _HAS_ZSTD = False
+
+
+# Serializes a list of leads to JSON bytes inside pydantic-core, without building per-lead dicts
+_LEAD_LIST_ADAPTER = TypeAdapter(List[LeadModel])
+# Validates one decoded lead record against the model, built once and reused
+_LEAD_VALIDATOR = TypeAdapter(LeadModel)
+# Leads serialized per adapter call; bounds memory while amortizing the call overhead
+_JSON_CHUNK_SIZE = 500
+# Leads flattened into column lists per batch of CSV rows
+_CSV_CHUNK_SIZE = 1024
+# Writes are gathered into blocks this large before reaching the compressor or the file
+_WRITE_BUFFER_SIZE = 256 * 1024
+# Buffer for export files on disk, so sequential writes reach the OS in few large syscalls
+_FILE_BUFFER_SIZE = 1 << 20
+# Byte order mark that lets Excel detect UTF-8 CSV files
+_UTF8_BOM = b'\xef\xbb\xbf'
+# Uncompressed bytes each mgzip thread compresses as one gzip member
+_PARALLEL_GZIP_BLOCK_SIZE = 4 << 20
+# zstd level 3 compresses about as fast as gzip level 1 with noticeably smaller output
+_ZSTD_LEVEL = 3
+# File suffix appended for each JSON export compression
+_COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+Compression = Literal["none", "gzip", "zstd"]
+# Serialized bytes aimed for per batch_export file when no explicit batch size is given.
+# Smaller batches flush the compressor more often (worse ratio); larger ones raise peak memory.
+TARGET_BATCH_BYTES = 16 * 1024 * 1024
+_MIN_BATCH_SIZE = 256
+_MAX_BATCH_SIZE = 50_000
+
+
+def _dumps(obj: Any, option: int = 0) -> bytes:
+    """Encode metadata-style objects with orjson; anything it cannot encode is written via str()"""
+    return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS, default=str)
+
+
+@contextmanager
+def _open_big(path: Union[str, Path], mode: str = 'wb', **kwargs) -> Iterator[Any]:
+    """
+    Open an export file with a large write buffer, creating its directory only if
+    the first open finds it missing. On close the kernel is told the file will not be re-read soon, so it can drop
+    the written pages from the page cache instead of evicting hotter data.
+    """
+    try:
+        f = open(path, mode, buffering=_FILE_BUFFER_SIZE, **kwargs)
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, mode, buffering=_FILE_BUFFER_SIZE, **kwargs)
+    try:
+        yield f
+    finally:
+        try:
+            if not f.closed:
+                f.flush()
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            f.close()
+
+
+class _PigzWriter:
+    """Binary writer that pipes into a `pigz` process compressing onto an open file"""
+    
+    def __init__(self, pigz: str, raw: Any, compresslevel: int, threads: int):
+        self._proc = subprocess.Popen(
+            [pigz, '-p', str(threads), f'-{compresslevel}', '-c'],
+            stdin=subprocess.PIPE, stdout=raw,
+        )
+        
+    def write(self, data: bytes) -> int:
+        return self._proc.stdin.write(data)
+        
+    def close(self) -> None:
+        self._proc.stdin.close()
+        if self._proc.wait() != 0:
+            raise OSError(f"pigz exited with status {self._proc.returncode}")
+            
+    def abort(self) -> None:
+        """Stop pigz without finishing the stream and reap it"""
+        self._proc.kill()
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        self._proc.wait()
+
+
+def _abort_writer(f: Any) -> None:
+    """Release a compressing writer after a failed export; the partial output is discarded anyway"""
+    abort = getattr(f, 'abort', None)
+    try:
+        if abort is not None:
+            abort()
+        else:
+            f.close()
+    except Exception as e:
+        logger.debug(f"Ignoring error while closing an aborted export stream: {e}")
+
+
+def _gzip_writer(raw: Any, output_file: Path, compresslevel: int) -> Any:
+    """
+    Gzip stream over `raw` that must be closed before `raw`.
+    Multi-core hosts compress in parallel with mgzip or, failing that, a pigz process;
+    otherwise the standard library compresses in-process.
+    """
+    threads = os.cpu_count() or 1
+    if threads > 1:
+        if _HAS_MGZIP:
+            return mgzip.MultiGzipFile(filename=str(output_file), mode='wb', fileobj=raw,
+                                       compresslevel=compresslevel, thread=threads,
+                                       blocksize=_PARALLEL_GZIP_BLOCK_SIZE)
+        pigz = shutil.which('pigz')
+        if pigz:
+            raw.flush()
+            return _PigzWriter(pigz, raw, compresslevel, threads)
+    return io.BufferedWriter(
+        gzip.GzipFile(filename=str(output_file), mode='wb', fileobj=raw, compresslevel=compresslevel),
+        buffer_size=_WRITE_BUFFER_SIZE
+    )
+
+
+def _check_compression(compression: str) -> None:
+    """Fail before any file is created if `compression` is unknown or its package is missing"""
+    if compression not in _COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    if compression == "zstd" and not _HAS_ZSTD:
+        raise ImportError("zstd compression requires the zstandard package")
+
+
+def _compressed_writer(raw: Any, output_file: Path, compression: Compression, compresslevel: int) -> Any:
+    """Compressing stream over `raw` for `compression`, or `raw` itself for 'none'"""
+    if compression == "gzip":
+        return _gzip_writer(raw, output_file, compresslevel)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1).stream_writer(raw, closefd=False)
+    return raw
+
+
+def _csv_text_writer(raw: Any, bom: bool) -> io.TextIOWrapper:
+    """
+    UTF-8 text stream for CSV rows over a binary stream.
+    The BOM is written once up front, so rows go through the plain utf-8 codec
+    rather than utf-8-sig.
+    """
+    if bom:
+        raw.write(_UTF8_BOM)
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='')
+
+
+def _flat_rows(leads: List[LeadModel], fields: List[str]) -> Iterator[tuple]:
+    """Flatten leads column-wise into `fields` order and return the rows; missing values are ''"""
+    count = len(leads)
+    columns = {field: [''] * count for field in fields}
+    for i, lead in enumerate(leads):
+        for field, value in lead._flat_iter():
+            column = columns.get(field)
+            if column is not None:
+                column[i] = value
+    return zip(*(columns[field] for field in fields))
+
+
+# Fields reported on the statistics sheet; the first four also carry confidence scores
+_STAT_FIELDS = ("email", "phone", "address", "website", "industry", "services")
+_CONFIDENCE_FIELDS = _STAT_FIELDS[:4]
+
+
+@dataclass
+class _SheetStats:
+    """Aggregates behind the summary and statistics sheets, gathered in one pass over the leads"""
+    total_leads: int = 0
+    scores: List[float] = field(default_factory=list)
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    industry_counts: Dict[str, int] = field(default_factory=dict)
+    field_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(_STAT_FIELDS, 0))
+    confidence_totals: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(_CONFIDENCE_FIELDS, 0.0))
+    confidence_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(_CONFIDENCE_FIELDS, 0))
+
+
+def _collect_sheet_stats(leads: List[LeadModel]) -> _SheetStats:
+    """Walk the leads once, updating every summary and statistics accumulator"""
+    stats = _SheetStats(total_leads=len(leads))
+    scores = stats.scores
+    status_counts = stats.status_counts
+    industry_counts = stats.industry_counts
+    counts = stats.field_counts
+    conf_totals = stats.confidence_totals
+    conf_counts = stats.confidence_counts
+    
+    for lead in leads:
+        status = lead.status.value
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if lead.lead_score is not None:
+            scores.append(lead.lead_score)
+            
+        confidence_scores = lead.confidence_scores
+        if lead.email:
+            counts["email"] += 1
+            if "email" in confidence_scores:
+                conf_totals["email"] += confidence_scores["email"]
+                conf_counts["email"] += 1
+        if lead.phone:
+            counts["phone"] += 1
+            if "phone" in confidence_scores:
+                conf_totals["phone"] += confidence_scores["phone"]
+                conf_counts["phone"] += 1
+        if lead.address:
+            counts["address"] += 1
+            if "address" in confidence_scores:
+                conf_totals["address"] += confidence_scores["address"]
+                conf_counts["address"] += 1
+        if lead.website:
+            counts["website"] += 1
+            if "website" in confidence_scores:
+                conf_totals["website"] += confidence_scores["website"]
+                conf_counts["website"] += 1
+        if lead.industry:
+            counts["industry"] += 1
+            industry_counts[lead.industry] = industry_counts.get(lead.industry, 0) + 1
+        if lead.services:
+            counts["services"] += 1
+            
+    return stats
+
 
 class ExportMetadata(dict):
     """Export metadata for tracking and validation"""
@@ -28,66 +279,127 @@ class ExportMetadata(dict):
         })
 
 
+# Field metadata never changes at runtime, so the export schema is built and encoded once
+_LEAD_FIELD_NAMES = tuple(LeadModel.model_fields)
+_LEAD_REQUIRED_FIELDS = tuple(name for name, info in LeadModel.model_fields.items() if info.is_required())
+_LEAD_SCHEMA = {
+    "version": "1.0",
+    "lead_model_fields": list(_LEAD_FIELD_NAMES),
+    "required_fields": list(_LEAD_REQUIRED_FIELDS),
+}
+_LEAD_SCHEMA_JSON = _dumps(_LEAD_SCHEMA)
+
+
+def _iter_json_chunks(leads: List[LeadModel],
+                      metadata: Optional[Dict[str, Any]]) -> Iterator[bytes]:
+    """Yield the JSON export document piece by piece, serializing a bounded chunk of leads at a time"""
+    yield b'{"leads": ['
+    for start in range(0, len(leads), _JSON_CHUNK_SIZE):
+        # Strip the list brackets so consecutive chunks splice into one array
+        chunk = _LEAD_LIST_ADAPTER.dump_json(leads[start:start + _JSON_CHUNK_SIZE])[1:-1]
+        yield b', ' + chunk if start else chunk
+    yield b']'
+    if metadata is not None:
+        yield b', "metadata": ' + _dumps(metadata)
+    yield b', "schema": ' + _LEAD_SCHEMA_JSON + b'}'
+
+
 class JSONExporter:
     """JSON export functionality with metadata and schema validation"""
     
-    def __init__(self, compress: bool = False):
-        self.compress = compress
+    def __init__(self, compress: bool = False, compresslevel: int = 1,
+                 compression: Optional[Compression] = None):
+        """
+        Args:
+            compress: Write gzip-compressed output (.gz appended to the file name)
+            compresslevel: gzip level; 1 favours export speed, 6 gives smaller archival files
+            compression: 'none', 'gzip' or 'zstd' (.zst, needs zstandard); overrides compress
+        """
+        if compression is None:
+            compression = "gzip" if compress else "none"
+        _check_compression(compression)
+        self.compression = compression
+        self.compress = compression != "none"
+        self.compresslevel = compresslevel
         
     def export_leads(self, 
                     leads: List[LeadModel], 
                     output_path: str,
                     include_metadata: bool = True,
-                    filters: Dict[str, Any] = None) -> str:
+                    filters: Dict[str, Any] = None,
+                    compression: Optional[Compression] = None) -> str:
         """Export leads to JSON format with metadata and schema validation"""
         
+        if not leads:
+            logger.warning("No leads to export")
+            return ""
+            
+        compression = compression or self.compression
+        _check_compression(compression)
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Prepare export data
-        export_data = {
-            "leads": [lead.dict() for lead in leads]
-        }
         
+        metadata = None
         if include_metadata:
-            export_data["metadata"] = ExportMetadata(
+            metadata = ExportMetadata(
                 export_type="json",
                 total_records=len(leads),
                 filters=filters
             )
             
-        # Add schema information
-        export_data["schema"] = {
-            "version": "1.0",
-            "lead_model_fields": list(LeadModel.__fields__.keys()),
-            "required_fields": [
-                field for field, info in LeadModel.__fields__.items() 
-                if info.is_required()
-            ]
-        }
-        
-        # Write to file
-        if self.compress:
-            output_file = output_file.with_suffix(output_file.suffix + '.gz')
-            with gzip.open(output_file, 'wt', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
-        else:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+        # Stream the document so memory holds one serialized lead at a time, not the whole export
+        output_file = output_file.with_suffix(output_file.suffix + _COMPRESSION_SUFFIXES[compression])
+        with _open_big(output_file) as raw:
+            f = _compressed_writer(raw, output_file, compression, self.compresslevel)
+            try:
+                for chunk in _iter_json_chunks(leads, metadata):
+                    f.write(chunk)
+            except BaseException:
+                # Reap the pigz process or mgzip threads before the error propagates
+                if f is not raw:
+                    _abort_writer(f)
+                raise
+            if f is not raw:
+                # Closes the compressed stream only; raw is closed by _open_big
+                f.close()
                 
         logger.info(f"Exported {len(leads)} leads to JSON: {output_file}")
         return str(output_file)
     
-    def validate_schema(self, json_file: str) -> Dict[str, Any]:
-        """Validate exported JSON against schema"""
+    def validate_schema(self, json_file: str, max_errors: int = 100) -> Dict[str, Any]:
+        """
+        Validate exported JSON against schema.
+        Leads are streamed with ijson when it is installed, so memory stays bounded;
+        validation stops after max_errors invalid leads.
+        """
         
         try:
             if json_file.endswith('.gz'):
-                with gzip.open(json_file, 'rt', encoding='utf-8') as f:
-                    data = json.load(f)
+                opener = gzip.open
+            elif json_file.endswith('.zst'):
+                if not _HAS_ZSTD:
+                    raise ImportError("reading .zst exports requires the zstandard package")
+                opener = zstandard.open
             else:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                opener = open
+            with opener(json_file, 'rb') as f:
+                if _HAS_IJSON:
+                    top_level_keys = set()
+                    
+                    def events():
+                        for prefix, event, value in ijson.parse(f, use_float=True):
+                            if prefix == '' and event == 'map_key':
+                                top_level_keys.add(value)
+                            yield prefix, event, value
+                            
+                    leads = ijson.items(events(), 'leads.item')
+                    lead_errors = self._validate_leads(leads, max_errors)
+                    # Drain the remaining events so keys after "leads" are seen
+                    for _ in leads:
+                        pass
+                else:
+                    data = orjson.loads(f.read())
+                    top_level_keys = set(data)
+                    lead_errors = self._validate_leads(data.get("leads", []), max_errors)
                     
             validation_result = {
                 "valid": True,
@@ -96,24 +408,21 @@ class JSONExporter:
             }
             
             # Check required structure
-            if "leads" not in data:
+            if "leads" not in top_level_keys:
                 validation_result["valid"] = False
                 validation_result["errors"].append("Missing 'leads' field")
                 
-            if "metadata" not in data:
+            if "metadata" not in top_level_keys:
                 validation_result["warnings"].append("Missing metadata field")
                 
-            if "schema" not in data:
+            if "schema" not in top_level_keys:
                 validation_result["warnings"].append("Missing schema field")
                 
-            # Validate individual leads
-            if "leads" in data:
-                for i, lead_data in enumerate(data["leads"]):
-                    try:
-                        LeadModel(**lead_data)
-                    except Exception as e:
-                        validation_result["valid"] = False
-                        validation_result["errors"].append(f"Lead {i}: {str(e)}")
+            if lead_errors:
+                validation_result["valid"] = False
+                validation_result["errors"].extend(lead_errors)
+                if len(lead_errors) >= max_errors:
+                    validation_result["warnings"].append(f"Stopped validating after {max_errors} errors")
                         
             return validation_result
             
@@ -123,6 +432,19 @@ class JSONExporter:
                 "errors": [f"Failed to validate file: {str(e)}"],
                 "warnings": []
             }
+    
+    @staticmethod
+    def _validate_leads(leads: Iterable[Any], max_errors: int) -> List[str]:
+        """Validate lead records in order, returning at most max_errors messages"""
+        errors = []
+        for i, lead_data in enumerate(leads):
+            try:
+                _LEAD_VALIDATOR.validate_python(lead_data)
+            except Exception as e:
+                errors.append(f"Lead {i}: {str(e)}")
+                if len(errors) >= max_errors:
+                    break
+        return errors
 
 
 class CSVExporter:
@@ -139,37 +461,19 @@ class CSVExporter:
                     filters: Dict[str, Any] = None) -> str:
         """Export leads to CSV format with Excel compatibility"""
         
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
         if not leads:
             logger.warning("No leads to export")
-            return str(output_file)
+            return ""
             
-        # Get flattened data
-        flattened_leads = [lead.to_flat_dict() for lead in leads]
-        
-        # Determine fields to export
-        all_fields = set()
-        for lead_dict in flattened_leads:
-            all_fields.update(lead_dict.keys())
-            
-        if custom_fields:
-            # Use only specified fields that exist
-            export_fields = [f for f in custom_fields if f in all_fields]
-        else:
-            # Use all fields, sorted for consistency
-            export_fields = sorted(all_fields)
+        output_file = Path(output_path)
+        export_fields = self._export_fields(leads, custom_fields)
             
         # Write CSV file
-        with open(output_file, 'w', newline='', encoding='utf-8-sig' if self.excel_compatible else 'utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=export_fields, extrasaction='ignore')
-            writer.writeheader()
-            
-            for lead_dict in flattened_leads:
-                # Fill missing fields with empty strings
-                row = {field: lead_dict.get(field, '') for field in export_fields}
-                writer.writerow(row)
+        with _open_big(output_file) as raw:
+            f = _csv_text_writer(raw, self.excel_compatible)
+            self._write_leads(leads, export_fields, f)
+            # Flushes the text layer and leaves raw to be closed by _open_big
+            f.detach()
                 
         logger.info(f"Exported {len(leads)} leads to CSV: {output_file}")
         
@@ -184,80 +488,109 @@ class CSVExporter:
             metadata["exported_fields"] = export_fields
             metadata["field_count"] = len(export_fields)
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            metadata_file.write_bytes(_dumps(metadata, orjson.OPT_INDENT_2))
                 
         return str(output_file)
     
+    @staticmethod
+    def _export_fields(leads: List[LeadModel], custom_fields: Optional[List[str]] = None) -> List[str]:
+        """Determine the CSV columns for a set of leads"""
+        
+        # The fixed columns plus each lead's confidence/social columns, collected
+        # without flattening so rows can be written as they are produced
+        all_fields = set(LeadModel.flat_fieldnames())
+        for lead in leads:
+            all_fields.update(lead.flat_extra_fieldnames())
+            
+        if custom_fields:
+            # Use only specified fields that exist
+            return [f for f in custom_fields if f in all_fields]
+        # Use all fields, sorted for consistency
+        return sorted(all_fields)
+    
+    @staticmethod
+    def _write_leads(leads: List[LeadModel], export_fields: List[str], f) -> None:
+        """Write the header and one row per lead to an open text file"""
+        writer = csv.writer(f)
+        writer.writerow(export_fields)
+        for start in range(0, len(leads), _CSV_CHUNK_SIZE):
+            writer.writerows(_flat_rows(leads[start:start + _CSV_CHUNK_SIZE], export_fields))
+    
     def export_to_excel_sheets(self, 
                               leads: List[LeadModel], 
                               output_path: str,
                               filters: Dict[str, Any] = None) -> str:
-        """Export to multiple CSV files simulating Excel sheets"""
+        """
+        Export to multiple CSV files simulating Excel sheets, bundled in a zip.
+        Each sheet is written straight into its zip entry, with no intermediate files.
+        """
         
-        output_dir = Path(output_path).parent / f"{Path(output_path).stem}_sheets"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Main leads sheet
-        main_file = output_dir / "leads.csv"
-        self.export_leads(leads, str(main_file), include_metadata_sheet=False, filters=filters)
+        if not leads:
+            logger.warning("No leads to export")
+            return ""
+            
+        zip_file = Path(output_path).with_suffix('.zip')
         
-        # Summary sheet
-        summary_file = output_dir / "summary.csv"
-        self._create_summary_sheet(leads, summary_file)
+        # Summary and statistics sheets share one pass over the leads
+        stats = _collect_sheet_stats(leads)
         
-        # Statistics sheet
-        stats_file = output_dir / "statistics.csv"
-        self._create_statistics_sheet(leads, stats_file)
+        def open_sheet(zf: zipfile.ZipFile, name: str, bom: bool = True) -> io.TextIOWrapper:
+            return _csv_text_writer(zf.open(name, 'w', force_zip64=True), bom)
         
-        # Create a zip file containing all sheets
-        zip_file = Path(output_path).with_suffix('.zip')
-        with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for csv_file in output_dir.glob("*.csv"):
-                zf.write(csv_file, csv_file.name)
+        with _open_big(zip_file) as raw, \
+                zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            # Main leads sheet
+            with open_sheet(zf, "leads.csv", self.excel_compatible) as f:
+                self._write_leads(leads, self._export_fields(leads), f)
+                
+            # Summary sheet
+            with open_sheet(zf, "summary.csv") as f:
+                self._create_summary_sheet(stats, f)
+                
+            # Statistics sheet
+            with open_sheet(zf, "statistics.csv") as f:
+                self._create_statistics_sheet(stats, f)
                 
         logger.info(f"Exported {len(leads)} leads to Excel-style sheets: {zip_file}")
         return str(zip_file)
     
-    def _create_summary_sheet(self, leads: List[LeadModel], output_file: Path):
-        """Create summary statistics sheet"""
-        
-        # Calculate summary statistics
-        total_leads = len(leads)
-        status_counts = {}
-        industry_counts = {}
-        scores = [lead.lead_score for lead in leads if lead.lead_score is not None]
-        
-        for lead in leads:
-            status_counts[lead.status.value] = status_counts.get(lead.status.value, 0) + 1
-            if lead.industry:
-                industry_counts[lead.industry] = industry_counts.get(lead.industry, 0) + 1
+    def _create_summary_sheet(self, stats: _SheetStats, f):
+        """Write the summary statistics sheet to an open text file"""
+        
+        total_leads = stats.total_leads
+        status_counts = stats.status_counts
+        industry_counts = stats.industry_counts
+        scores = np.fromiter(stats.scores, dtype=np.float64, count=len(stats.scores))
+        
+        if scores.size:
+            avg_score = f"{scores.mean():.2f}"
+            min_score = f"{scores.min():.2f}"
+            max_score = f"{scores.max():.2f}"
+        else:
+            avg_score = min_score = max_score = "N/A"
         
         summary_data = [
-            {"Metric", "Value"},
-            {"Total Leads", total_leads},
-            {"Average Score", f"{sum(scores) / len(scores):.2f}" if scores else "N/A"},
-            {"Min Score", f"{min(scores):.2f}" if scores else "N/A"},
-            {"Max Score", f"{max(scores):.2f}" if scores else "N/A"},
-            {"", ""},
-            {"Status Distribution", ""},
+            ("Metric", "Value"),
+            ("Total Leads", total_leads),
+            ("Average Score", avg_score),
+            ("Min Score", min_score),
+            ("Max Score", max_score),
+            ("", ""),
+            ("Status Distribution", ""),
         ]
         
         for status, count in status_counts.items():
-            summary_data.append({status.title(), count})
+            summary_data.append((status.title(), count))
             
-        summary_data.extend([{"", ""}, {"Industry Distribution", ""}])
+        summary_data.extend([("", ""), ("Industry Distribution", "")])
         
         for industry, count in sorted(industry_counts.items()):
-            summary_data.append({industry, count})
+            summary_data.append((industry, count))
             
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            for row in summary_data:
-                writer.writerow(row)
+        csv.writer(f).writerows(summary_data)
     
-    def _create_statistics_sheet(self, leads: List[LeadModel], output_file: Path):
-        """Create detailed statistics sheet"""
+    def _create_statistics_sheet(self, stats: _SheetStats, f):
+        """Write the detailed statistics sheet to an open text file"""
         
         stats_data = [
             ["Field", "Filled Count", "Fill Rate %", "Avg Confidence"],
@@ -269,62 +602,40 @@ class CSVExporter:
             ["Services", 0, 0, "N/A"],
         ]
         
-        total_leads = len(leads)
-        if total_leads == 0:
-            return
+        total_leads = stats.total_leads
             
-        # Calculate field statistics
-        field_stats = {
-            "email": {"count": 0, "confidence": []},
-            "phone": {"count": 0, "confidence": []},
-            "address": {"count": 0, "confidence": []},
-            "website": {"count": 0, "confidence": []},
-            "industry": {"count": 0},
-            "services": {"count": 0},
-        }
-        
-        for lead in leads:
-            if lead.email:
-                field_stats["email"]["count"] += 1
-                if "email" in lead.confidence_scores:
-                    field_stats["email"]["confidence"].append(lead.confidence_scores["email"])
-                    
-            if lead.phone:
-                field_stats["phone"]["count"] += 1
-                if "phone" in lead.confidence_scores:
-                    field_stats["phone"]["confidence"].append(lead.confidence_scores["phone"])
-                    
-            if lead.address:
-                field_stats["address"]["count"] += 1
-                if "address" in lead.confidence_scores:
-                    field_stats["address"]["confidence"].append(lead.confidence_scores["address"])
-                    
-            if lead.website:
-                field_stats["website"]["count"] += 1
-                if "website" in lead.confidence_scores:
-                    field_stats["website"]["confidence"].append(lead.confidence_scores["website"])
-                    
-            if lead.industry:
-                field_stats["industry"]["count"] += 1
-                
-            if lead.services:
-                field_stats["services"]["count"] += 1
-        
         # Update stats data
-        for i, field in enumerate(["email", "phone", "address", "website", "industry", "services"], 1):
-            count = field_stats[field]["count"]
+        for i, field in enumerate(_STAT_FIELDS, 1):
+            count = stats.field_counts[field]
             fill_rate = (count / total_leads) * 100
             
             stats_data[i][1] = count
             stats_data[i][2] = f"{fill_rate:.1f}%"
             
-            if "confidence" in field_stats[field] and field_stats[field]["confidence"]:
-                avg_conf = sum(field_stats[field]["confidence"]) / len(field_stats[field]["confidence"])
+            conf_count = stats.confidence_counts.get(field)
+            if conf_count:
+                avg_conf = stats.confidence_totals[field] / conf_count
                 stats_data[i][3] = f"{avg_conf:.2f}"
         
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            writer.writerows(stats_data)
+        writer = csv.writer(f)
+        writer.writerows(stats_data)
+
+
+def _export_batch(batch: List[LeadModel], fmt: str, batch_file: str,
+                  json_exporter: JSONExporter, csv_exporter: CSVExporter,
+                  compression: Optional[Compression] = None) -> Optional[str]:
+    """
+    Write one batch in one format with the manager's exporters.
+    Kept at module level so it can run in a ProcessPoolExecutor worker; the exporters
+    are pickled along with the batch, so their settings carry over to the worker.
+    """
+    if fmt == "json":
+        return json_exporter.export_leads(batch, batch_file, compression=compression)
+    elif fmt == "csv":
+        return csv_exporter.export_leads(batch, batch_file)
+    elif fmt == "excel":
+        return csv_exporter.export_to_excel_sheets(batch, batch_file)
+    return None
 
 
 class ExportManager:
@@ -380,8 +691,19 @@ class ExportManager:
     def batch_export(self, 
                     output_dir: str,
                     formats: List[str] = ["json", "csv"],
-                    batch_size: int = 1000) -> Dict[str, List[str]]:
-        """Export all leads in batches across multiple formats"""
+                    batch_size: Optional[int] = None,
+                    max_workers: Optional[int] = None,
+                    target_batch_bytes: int = TARGET_BATCH_BYTES,
+                    compression: Optional[Compression] = None) -> Dict[str, List[str]]:
+        """
+        Export all leads in batches across multiple formats.
+        Without an explicit batch_size, it is sized so each batch serializes to about
+        target_batch_bytes, judged from the first lead.
+        Each (batch, format) file is written by a separate worker process;
+        max_workers defaults to os.cpu_count() and 1 writes everything in-process.
+        compression applies to the JSON batches ('none', 'gzip' or 'zstd') and defaults to
+        json_exporter's setting; the other exporter settings are used as configured.
+        """
         
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -389,24 +711,43 @@ class ExportManager:
         all_leads = self.storage.load_all_leads()
         exported_files = {fmt: [] for fmt in formats}
         
-        # Process in batches
+        if batch_size is None:
+            batch_size = self._adaptive_batch_size(all_leads, target_batch_bytes)
+        
+        tasks = []
         for i in range(0, len(all_leads), batch_size):
             batch = all_leads[i:i + batch_size]
             batch_num = i // batch_size + 1
             
             for fmt in formats:
-                batch_file = output_path / f"leads_batch_{batch_num:03d}.{fmt}"
-                
-                if fmt == "json":
-                    file_path = self.json_exporter.export_leads(batch, str(batch_file))
-                elif fmt == "csv":
-                    file_path = self.csv_exporter.export_leads(batch, str(batch_file))
-                elif fmt == "excel":
-                    file_path = self.csv_exporter.export_to_excel_sheets(batch, str(batch_file))
-                else:
+                if fmt not in ("json", "csv", "excel"):
                     continue
-                    
-                exported_files[fmt].append(file_path)
+                batch_file = output_path / f"leads_batch_{batch_num:03d}.{fmt}"
+                tasks.append((batch, fmt, str(batch_file)))
+        
+        exporters = (self.json_exporter, self.csv_exporter)
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        if workers <= 1:
+            for batch, fmt, batch_file in tasks:
+                exported_files[fmt].append(_export_batch(batch, fmt, batch_file, *exporters, compression))
+        else:
+            # Forked workers would inherit the caller's threads and locks (loguru's included)
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context(start_method)) as executor:
+                futures = [(fmt, executor.submit(_export_batch, batch, fmt, batch_file, *exporters, compression))
+                           for batch, fmt, batch_file in tasks]
+                # Collected in submission order so each list stays sorted by batch number
+                for fmt, future in futures:
+                    exported_files[fmt].append(future.result())
         
         logger.info(f"Batch export completed: {len(all_leads)} leads in {len(exported_files['json'])} batches")
         return exported_files
+    
+    @staticmethod
+    def _adaptive_batch_size(leads: List[LeadModel], target_batch_bytes: int) -> int:
+        """Leads per batch so a batch serializes to roughly target_batch_bytes"""
+        if not leads:
+            return _MIN_BATCH_SIZE
+        est_bytes = max(1, len(leads[0].model_dump_json()))
+        return max(_MIN_BATCH_SIZE, min(_MAX_BATCH_SIZE, target_batch_bytes // est_bytes))
@@ -5,8 +5,9 @@ import csv
 import gzip
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 from enum import Enum
+from functools import cached_property, lru_cache
 import uuid
 
 from pydantic import BaseModel, Field, field_validator
@@ -51,6 +52,27 @@ class BusinessInfo(BaseModel):
     description: Optional[str] = None
 
 
+def _safe_list_to_string(value: Any) -> str:
+    """Join list values with '; ' for flat export; None becomes ''"""
+    if isinstance(value, list):
+        return '; '.join(str(item) for item in value)
+    elif value is None:
+        return ''
+    else:
+        return str(value)
+
+
+def _format_factor_scores(factor_scores: List[Dict[str, Any]]) -> str:
+    """Render factor scores as 'factor:score' pairs for flat export"""
+    if not factor_scores:
+        return ''
+    try:
+        return '; '.join(f"{fs.get('factor', 'unknown')}:{fs.get('score', 0)}" 
+                      for fs in factor_scores if isinstance(fs, dict))
+    except Exception:
+        return str(factor_scores) if factor_scores else ''
+
+
 class LeadModel(BaseModel):
     """Complete lead data model as specified in Phase 7.1"""
     
@@ -115,64 +137,82 @@ class LeadModel(BaseModel):
         else:
             return datetime.now()
     
-    def to_flat_dict(self) -> Dict[str, Any]:
-        """Convert to flattened dictionary for CSV export"""
-        # Helper function to safely convert lists to strings
-        def safe_list_to_string(value):
+    @cached_property
+    def _dedup_keys(self) -> FrozenSet[Tuple[str, Any]]:
+        """Normalized (type, value) keys for duplicate detection, computed once per lead"""
+        def as_list(value):
+            if isinstance(value, str):
+                return [value]
             if isinstance(value, list):
-                return '; '.join(str(item) for item in value)
-            elif value is None:
-                return ''
-            else:
-                return str(value)
+                return value
+            return []
         
-        # Helper function to safely convert factor_scores
-        def format_factor_scores(factor_scores):
-            if not factor_scores:
-                return ''
-            try:
-                return '; '.join(f"{fs.get('factor', 'unknown')}:{fs.get('score', 0)}" 
-                              for fs in factor_scores if isinstance(fs, dict))
-            except Exception:
-                return str(factor_scores) if factor_scores else ''
+        keys = {('email', email.lower().strip()) for email in as_list(self.email) if email}
+        keys.update(('phone', ''.join(filter(str.isdigit, phone))) for phone in as_list(self.phone) if phone)
         
-        flat = {
-            'id': self.id,
-            'source_url': self.source_url,
-            'extraction_timestamp': self.extraction_timestamp.isoformat(),
-            'business_name': self.business_name or '',
-            'contact_person': safe_list_to_string(self.contact_person),
-            'email': safe_list_to_string(self.email),
-            'phone': safe_list_to_string(self.phone),
-            'address': safe_list_to_string(self.address),
-            'website': safe_list_to_string(self.website),
-            'industry': self.industry or '',
-            'services': safe_list_to_string(self.services),
-            'lead_score': self.lead_score,
-            'lead_classification': self.lead_classification or '',
-            'factor_scores': format_factor_scores(self.factor_scores),
-            'data_sources': safe_list_to_string(self.data_sources),
-            'quality_score': self.quality_score,
-            'quality_grade': self.quality_grade or '',
-            'notes': self.notes or '',
-            'ai_leads_count': len(self.ai_leads),
-            'ai_leads': json.dumps(self.ai_leads) if self.ai_leads else '',
-            'status': self.status.value
-        }
+        # Business name only identifies a lead together with one of its websites
+        business_name = self.business_name.lower().strip() if self.business_name else None
+        if business_name:
+            keys.update(('bizweb', (business_name, website.strip())) for website in as_list(self.website) if website)
+        
+        return frozenset(keys)
+    
+    def _flat_iter(self) -> Iterator[Tuple[str, Any]]:
+        """Yield (column, value) pairs of the flattened lead, in to_flat_dict order"""
+        yield 'id', self.id
+        yield 'source_url', self.source_url
+        yield 'extraction_timestamp', self.extraction_timestamp.isoformat()
+        yield 'business_name', self.business_name or ''
+        yield 'contact_person', _safe_list_to_string(self.contact_person)
+        yield 'email', _safe_list_to_string(self.email)
+        yield 'phone', _safe_list_to_string(self.phone)
+        yield 'address', _safe_list_to_string(self.address)
+        yield 'website', _safe_list_to_string(self.website)
+        yield 'industry', self.industry or ''
+        yield 'services', _safe_list_to_string(self.services)
+        yield 'lead_score', self.lead_score
+        yield 'lead_classification', self.lead_classification or ''
+        yield 'factor_scores', _format_factor_scores(self.factor_scores)
+        yield 'data_sources', _safe_list_to_string(self.data_sources)
+        yield 'quality_score', self.quality_score
+        yield 'quality_grade', self.quality_grade or ''
+        yield 'notes', self.notes or ''
+        yield 'ai_leads_count', len(self.ai_leads)
+        yield 'ai_leads', json.dumps(self.ai_leads) if self.ai_leads else ''
+        yield 'status', self.status.value
         
         # Add confidence scores as separate columns
         for field, score in self.confidence_scores.items():
-            flat[f'confidence_{field}'] = score
+            yield f'confidence_{field}', score
             
         # Add social media profiles
         for platform, profile in self.social_media.items():
-            flat[f'social_{platform}_url'] = profile.url
+            yield f'social_{platform}_url', profile.url
             if profile.followers is not None:
-                flat[f'social_{platform}_followers'] = profile.followers
+                yield f'social_{platform}_followers', profile.followers
             if profile.verified is not None:
-                flat[f'social_{platform}_verified'] = profile.verified
-                
-        return flat
+                yield f'social_{platform}_verified', profile.verified
+    
+    def to_flat_dict(self) -> Dict[str, Any]:
+        """Convert to flattened dictionary for CSV export"""
+        return dict(self._flat_iter())
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def flat_fieldnames(cls) -> Tuple[str, ...]:
+        """Columns to_flat_dict produces for every lead, in order (taken once from an empty lead)"""
+        return tuple(cls(source_url='').to_flat_dict())
+    
+    def flat_extra_fieldnames(self) -> Iterator[str]:
+        """Yield the lead-specific confidence and social columns to_flat_dict adds, without flattening"""
+        for field in self.confidence_scores:
+            yield f'confidence_{field}'
+        for platform, profile in self.social_media.items():
+            yield f'social_{platform}_url'
+            if profile.followers is not None:
+                yield f'social_{platform}_followers'
+            if profile.verified is not None:
+                yield f'social_{platform}_verified'
     
     @staticmethod
     def calculate_composite_confidence(items: List[Dict[str, Any]]) -> float:
@@ -305,13 +345,14 @@ class LeadStorage:
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         
-    def save_lead(self, lead: LeadModel) -> str:
-        """Save a single lead to storage"""
+    def save_lead(self, lead: LeadModel, lead_dict: Optional[Dict[str, Any]] = None) -> str:
+        """Save a single lead to storage, reusing lead_dict if the caller already dumped the model"""
         lead_file = self.storage_path / f"lead_{lead.id}.json"
         
         try:
             # Convert lead to dict and handle datetime serialization
-            lead_dict = lead.model_dump()
+            if lead_dict is None:
+                lead_dict = lead.model_dump()
             
             with open(lead_file, 'w', encoding='utf-8') as f:
                 json.dump(lead_dict, f, indent=2, ensure_ascii=False, default=str)
@@ -322,12 +363,15 @@ class LeadStorage:
             logger.error(f"Failed to save lead {lead.id}: {e}")
             raise
     
-    def save_leads_batch(self, leads: List[LeadModel]) -> List[str]:
-        """Save multiple leads to storage"""
+    def save_leads_batch(self, leads: List[LeadModel], lead_dicts: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """Save multiple leads to storage, optionally with their already-dumped dicts"""
+        if lead_dicts is None:
+            lead_dicts = [None] * len(leads)
+        
         saved_files = []
-        for lead in leads:
+        for lead, lead_dict in zip(leads, lead_dicts):
             try:
-                saved_files.append(self.save_lead(lead))
+                saved_files.append(self.save_lead(lead, lead_dict))
             except Exception as e:
                 logger.error(f"Failed to save lead {lead.id}: {e}")
                 continue
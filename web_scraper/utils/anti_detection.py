@@ -453,6 +453,10 @@ class AntiDetectionManager:
     
     async def calculate_request_delay(self) -> float:
         """Calculate delay for next request based on network obfuscation"""
+        return self.calculate_request_delay_sync()
+    
+    def calculate_request_delay_sync(self) -> float:
+        """Synchronous calculate_request_delay for callers without an event loop"""
         if not self.enable_network_obfuscation:
             return 0.0
         
@@ -472,6 +476,10 @@ class AntiDetectionManager:
     
     async def should_rotate_fingerprint(self) -> bool:
         """Determine if fingerprint should be rotated"""
+        return self.should_rotate_fingerprint_sync()
+    
+    def should_rotate_fingerprint_sync(self) -> bool:
+        """Synchronous should_rotate_fingerprint for callers without an event loop"""
         if not self.enable_fingerprint_evasion:
             return False
         
@@ -531,42 +539,47 @@ class AntiDetectionManager:
         }
 
 
-async def create_stealth_browser_context(playwright, anti_detection_manager: AntiDetectionManager, is_mobile: bool = False):
-    """Create a stealth browser context with anti-detection measures"""
-    context_options = await anti_detection_manager.generate_stealth_context_options(is_mobile=is_mobile)
-    
-    browser = await playwright.chromium.launch(
-        headless=context_options.get('headless', True),
-        args=[
-            '--no-sandbox',
-            '--disable-blink-features=AutomationControlled',
-            '--disable-dev-shm-usage',
-            '--disable-web-security',
-            '--disable-features=VizDisplayCompositor',
-            '--disable-extensions',
-            '--disable-plugins',
-            '--disable-background-timer-throttling',
-            '--disable-backgrounding-occluded-windows',
-            '--disable-renderer-backgrounding',
-            '--disable-field-trial-config',
-            '--disable-ipc-flooding-protection',
-            '--no-first-run',
-            '--no-default-browser-check',
-            '--disable-default-apps',
-            '--disable-sync',
-            '--disable-translate',
-            '--hide-scrollbars',
-            '--mute-audio',
-            '--no-zygote',
-            '--disable-gpu',
-            '--disable-software-rasterizer',
-            '--disable-background-networking',
-            '--disable-client-side-phishing-detection',
-            '--disable-component-extensions-with-background-pages',
-            '--disable-domain-reliability',
-            '--disable-features=TranslateUI'
-        ]
-    )
+STEALTH_BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-field-trial-config',
+    '--disable-ipc-flooding-protection',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-zygote',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-background-networking',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-domain-reliability',
+    '--disable-features=TranslateUI',
+]
+
+
+async def launch_stealth_browser(playwright, headless: bool = True):
+    """Launch a Chromium browser with the stealth command-line flags"""
+    return await playwright.chromium.launch(headless=headless, args=STEALTH_BROWSER_ARGS)
+
+
+async def create_stealth_context(browser, anti_detection_manager: AntiDetectionManager, is_mobile: bool = False,
+                                 context_options: Optional[Dict[str, Any]] = None):
+    """Create a stealth context with a fresh fingerprint on an already running browser"""
+    if context_options is None:
+        context_options = await anti_detection_manager.generate_stealth_context_options(is_mobile=is_mobile)
     
     context = await browser.new_context(**context_options)
     
@@ -574,6 +587,16 @@ async def create_stealth_browser_context(playwright, anti_detection_manager: Ant
     for script in stealth_scripts:
         await context.add_init_script(script)
     
+    return context
+
+
+async def create_stealth_browser_context(playwright, anti_detection_manager: AntiDetectionManager, is_mobile: bool = False):
+    """Create a stealth browser context with anti-detection measures"""
+    context_options = await anti_detection_manager.generate_stealth_context_options(is_mobile=is_mobile)
+    
+    browser = await launch_stealth_browser(playwright, headless=context_options.get('headless', True))
+    context = await create_stealth_context(browser, anti_detection_manager, context_options=context_options)
+    
     return browser, context
 
 